@@ -1,5 +1,6 @@
 import os
-from typing import List
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
 from .enums import Language
 from .exceptions import WordlistError
 
@@ -68,6 +69,12 @@ class BIP39_List:
         with open(spanish_path, "r", encoding="utf-8") as f:
             self.Spanish = [line.strip() for line in f.readlines()]
 
+        # Lookup tables are built on first use for each language, or pair of
+        # languages, and reused afterwards.
+        self._index_tables = {}
+        self._translation_tables = {}
+        self._prefix_tables = {}
+
 
     def get_language(self, word: str) -> List[Language]:
         """
@@ -77,35 +84,9 @@ class BIP39_List:
         """
         languages = []
 
-        if word in self.ChineseSimplified:
-            languages.append(Language.ChineseSimplified)
-
-        if word in self.ChineseTraditional:
-            languages.append(Language.ChineseTraditional)
-
-        if word in self.Czech:
-            languages.append(Language.Czech)
-
-        if word in self.English:
-            languages.append(Language.English)
-
-        if word in self.French:
-            languages.append(Language.French)
-
-        if word in self.Italian:
-            languages.append(Language.Italian)
-
-        if word in self.Japanese:
-            languages.append(Language.Japanese)
-
-        if word in self.Korean:
-            languages.append(Language.Korean)
-
-        if word in self.Portuguese:
-            languages.append(Language.Portuguese)
-
-        if word in self.Spanish:
-            languages.append(Language.Spanish)
+        for language in Language:
+            if word in self.get_index_table(language):
+                languages.append(language)
 
         return languages
 
@@ -161,8 +142,134 @@ class BIP39_List:
         if not isinstance(language, Language):
             raise ValueError(f"{language} is not in the language list.")
 
-        if language not in self.get_language(word):
+        index_table = self.get_index_table(language)
+
+        if word not in index_table:
             raise WordlistError(word, language)
 
-        return self.get_word_list(language).index(word)
-        
\ No newline at end of file
+        return index_table[word]
+
+
+    def get_index_table(self, language: Language) -> Dict[str, int]:
+        """
+        Returns a dictionary of each word in the given language's word list,
+        mapped to its index. The table is built on first use.
+        """
+        if not isinstance(language, Language):
+            raise ValueError(f"{language} is not in the language list.")
+
+        index_table = self._index_tables.get(language)
+
+        if index_table is None:
+            word_list = self.get_word_list(language)
+            index_table = {word: index for index, word in enumerate(word_list)}
+            self._index_tables[language] = index_table
+
+        return index_table
+
+
+    def get_translation_table(
+            self, source: Language, target: Language
+            ) -> Dict[str, str]:
+        """
+        Returns a dictionary of each word in the source language's word list,
+        mapped to the word at the same index in the target language's word
+        list. The table is built on first use.
+        """
+        if not isinstance(source, Language):
+            raise ValueError(f"{source} is not in the language list.")
+
+        if not isinstance(target, Language):
+            raise ValueError(f"{target} is not in the language list.")
+
+        translation_table = self._translation_tables.get((source, target))
+
+        if translation_table is None:
+            source_list = self.get_word_list(source)
+            target_list = self.get_word_list(target)
+            translation_table = dict(zip(source_list, target_list))
+            self._translation_tables[(source, target)] = translation_table
+
+        return translation_table
+
+
+    def get_prefix_matches(
+            self, prefix: str, language: Language
+            ) -> List[Tuple[str, int]]:
+        """
+        Returns each word of the given language that starts with the given
+        prefix, along with its index, in sorted order of the words.
+        """
+        sorted_words, sorted_indices = self._get_prefix_table(language)
+        start = bisect_left(sorted_words, prefix)
+        end = start
+
+        while end < len(sorted_words) and sorted_words[end].startswith(prefix):
+            end += 1
+
+        return list(zip(sorted_words[start:end], sorted_indices[start:end]))
+
+
+    def complete_word(
+            self, prefix: str, language: Language
+            ) -> Optional[Tuple[str, int]]:
+        """
+        Returns the word of the given language that the given prefix
+        identifies, along with its index. This is the word equal to the prefix,
+        or else the only word starting with the prefix. Returns None if the
+        prefix is ambiguous or matches no word.
+        """
+        index_table = self.get_index_table(language)
+
+        if prefix in index_table:
+            return prefix, index_table[prefix]
+
+        sorted_words, sorted_indices = self._get_prefix_table(language)
+        position = bisect_left(sorted_words, prefix)
+
+        if position == len(sorted_words):
+            return None
+
+        if not sorted_words[position].startswith(prefix):
+            return None
+
+        next_position = position + 1
+
+        if next_position < len(sorted_words):
+            if sorted_words[next_position].startswith(prefix):
+                return None
+
+        return sorted_words[position], sorted_indices[position]
+
+
+    def is_valid_prefix(self, prefix: str, language: Language) -> bool:
+        """
+        Returns true if at least one word of the given language starts with
+        the given prefix.
+        """
+        sorted_words, _ = self._get_prefix_table(language)
+        position = bisect_left(sorted_words, prefix)
+
+        if position == len(sorted_words):
+            return False
+
+        return sorted_words[position].startswith(prefix)
+
+
+    def _get_prefix_table(
+            self, language: Language
+            ) -> Tuple[List[str], List[int]]:
+        """
+        Returns the words of the given language in sorted order, and the index
+        of each of those words. The table is built on first use.
+        """
+        prefix_table = self._prefix_tables.get(language)
+
+        if prefix_table is None:
+            index_table = self.get_index_table(language)
+            sorted_words = sorted(index_table)
+            sorted_indices = [index_table[word] for word in sorted_words]
+            prefix_table = (sorted_words, sorted_indices)
+            self._prefix_tables[language] = prefix_table
+
+        return prefix_table
@@ -1,13 +1,32 @@
 from .bitcoinshamir import *
-from .enums import Language, Checksum
+from .enums import Language, Checksum, ShareStatus
 from .exceptions import *
 from .BIP39_List import BIP39_List
 from .lagrange import Lagrange
+from .gf256 import GF256
 from .decode import Decode
 from .encode import Encode
-from .mnemonic import Mnemonic
+from .mnemonic import Mnemonic, MnemonicBatch
 from .share import Share
 from .point import Point
+from .pile import ShareIndex
+from .cache import RecoveryCache
 from .polynomial import Polynomial
+from .stream import split_stream, combine_streams
+from .compact import (
+    encode_share, decode_share, encode_shares, decode_shares, encode_mnemonic,
+    decode_mnemonic, encode_mnemonics, decode_mnemonics, phrase_to_compact,
+    compact_to_phrase, phrases_to_compact, compact_to_phrases
+)
+from .derivation import (
+    derive_seeds, derive_fingerprints, get_seed_fingerprint
+)
+from .field import (
+    PythonBackend, Gmpy2Backend, get_backend, set_backend, benchmark_backends
+)
+from .aio import (
+    configure_async, create_shares_async, recover_mnemonic_async,
+    share_from_phrase_async
+)
 
 wordlist = BIP39_List()
\ No newline at end of file
@@ -0,0 +1,93 @@
+import argparse
+import json
+import sys
+from typing import List, Optional
+from .exceptions import LoadTestError
+from .loadtest import check_ceilings, run_load_test
+from .server import serve
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Runs the bitcoinshamir command line interface.
+    """
+    parser = argparse.ArgumentParser(prog="bitcoinshamir")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser(
+        "serve", help="run the local split and recover daemon"
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8339)
+    serve_parser.add_argument(
+        "--allow-remote", action="store_true",
+        help="allow a host that is not a loopback address"
+    )
+    serve_parser.add_argument(
+        "--unix-socket",
+        help="listen on this Unix socket path instead, with 0600 permissions"
+    )
+    serve_parser.add_argument(
+        "--batch-window", type=float, default=2.0,
+        help="milliseconds to wait for requests to batch together"
+    )
+    serve_parser.add_argument("--max-batch", type=int, default=256)
+
+    loadtest_parser = commands.add_parser(
+        "loadtest", help="run the end-to-end scaling and memory load test"
+    )
+    loadtest_parser.add_argument(
+        "--vaults", type=int, nargs="+", default=[1000],
+        help="vault population sizes to test"
+    )
+    loadtest_parser.add_argument("--min-threshold", type=int, default=2)
+    loadtest_parser.add_argument("--max-threshold", type=int, default=17)
+    loadtest_parser.add_argument("--extra-shares", type=int, default=2)
+    loadtest_parser.add_argument("--max-peak-mb", type=float)
+    loadtest_parser.add_argument("--max-p99-ms", type=float)
+    loadtest_parser.add_argument("--min-vaults-per-second", type=float)
+    loadtest_parser.add_argument(
+        "--trace-memory", action="store_true",
+        help="measure peak memory in a second run under tracemalloc"
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        try:
+            serve(
+                args.host, args.port, args.unix_socket,
+                args.batch_window / 1000, args.max_batch, args.allow_remote
+            )
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            sys.exit(1)
+    elif args.command == "loadtest":
+        thresholds = range(args.min_threshold, args.max_threshold + 1)
+        max_peak_memory = None
+
+        if args.max_peak_mb is not None:
+            max_peak_memory = int(args.max_peak_mb * 1024 * 1024)
+
+        # A peak memory ceiling needs the traced run.
+        trace_memory = args.trace_memory or max_peak_memory is not None
+
+        for vault_count in args.vaults:
+            report = run_load_test(
+                vault_count, thresholds, args.extra_shares,
+                trace_memory=trace_memory
+            )
+            print(json.dumps(report, indent=2))
+
+            try:
+                check_ceilings(
+                    report, max_peak_memory, args.max_p99_ms,
+                    args.min_vaults_per_second
+                )
+            except LoadTestError as error:
+                print(error, file=sys.stderr)
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
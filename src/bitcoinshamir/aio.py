@@ -0,0 +1,180 @@
+import asyncio
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+from .bitcoinshamir import PRIME_MODULUS, create_shares, recover_mnemonic
+from .enums import Language
+from .lagrange import Lagrange
+from .mnemonic import Mnemonic
+from .share import (
+    Share, GF256_VERSION, MAX_THRESHOLDS, MAX_X_VALUES, SHARE_VERSIONS,
+    current_version
+)
+
+
+# Executor used for the big-int work. None uses the event loop's default
+# thread pool executor.
+executor = None
+
+# Maximum number of calls running on the executor at once, per event loop.
+# Further calls wait for a free slot, which applies backpressure to callers.
+max_concurrency = 8
+
+# Per event loop state, which is dropped along with its loop.
+_loop_states = weakref.WeakKeyDictionary()
+
+
+class _LoopState:
+    """
+    Holds the concurrency limit and in-flight basis calculations for a single
+    event loop.
+    """
+    def __init__(self, concurrency: int) -> None:
+        """
+        Initializes a new instance of the _LoopState class with the given limit
+        of concurrent executor calls.
+        """
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.pending_bases = {}
+
+
+def configure_async(
+        new_executor: Optional[Executor] = None, concurrency: int = 8
+        ) -> None:
+    """
+    Sets the executor and the maximum number of concurrent executor calls used
+    by the async functions. A ProcessPoolExecutor keeps the event loop's
+    process free of the work entirely, but each worker process keeps its own
+    basis cache, so calls are only coalesced for thread pool executors.
+    """
+    global executor, max_concurrency
+
+    if new_executor is not None and not isinstance(new_executor, Executor):
+        raise TypeError("The given executor was not of the Executor type.")
+
+    if not isinstance(concurrency, int):
+        raise TypeError("The concurrency argument was not of the int type.")
+
+    if concurrency < 1:
+        raise ValueError("The given concurrency argument is out of bounds.")
+
+    executor = new_executor
+    max_concurrency = concurrency
+    _loop_states.clear()
+
+
+async def create_shares_async(
+        threshold: int, sharecount: int, mnemonic: Mnemonic,
+        version: int = current_version) -> List[Share]:
+    """
+    Runs create_shares() on the configured executor. Concurrent calls with the
+    same threshold, sharecount, and prime field version share one basis
+    calculation.
+    """
+    layout = None
+    is_prime_field = version in SHARE_VERSIONS and version != GF256_VERSION
+
+    if isinstance(threshold, int) and isinstance(sharecount, int):
+        if is_prime_field:
+            max_threshold = MAX_THRESHOLDS[version]
+            max_sharecount = MAX_X_VALUES[version] - 1
+
+            is_valid_threshold = 2 <= threshold <= max_threshold
+            is_valid_sharecount = threshold <= sharecount <= max_sharecount
+
+            if is_valid_threshold and is_valid_sharecount:
+                x_values = tuple(range(threshold))
+                layout = (x_values, tuple(range(threshold, sharecount + 2)))
+
+    return await _run(
+        layout, create_shares, threshold, sharecount, mnemonic, version
+    )
+
+
+async def recover_mnemonic_async(shares: List[Share]) -> Mnemonic:
+    """
+    Runs recover_mnemonic() on the configured executor. Concurrent calls with
+    prime field shares of the same X-values share one basis calculation.
+    """
+    layout = None
+
+    if isinstance(shares, list) and shares:
+        is_shares = all(isinstance(share, Share) for share in shares)
+
+        if is_shares and shares[0].version != GF256_VERSION:
+            x_values = tuple(sorted(share.point.X for share in shares))
+            layout = (x_values, (0, 1))
+
+    return await _run(layout, recover_mnemonic, shares)
+
+
+async def share_from_phrase_async(
+        phrase: List[str], language: Language
+        ) -> Share:
+    """
+    Runs Share.from_share_phrase() on the configured executor.
+    """
+    return await _run(None, Share.from_share_phrase, phrase, language)
+
+
+async def _run(
+        layout: Optional[Tuple[Tuple[int, ...], Tuple[int, ...]]],
+        func: Callable, *args: object) -> object:
+    """
+    Calls the given function with the given arguments on the configured
+    executor, once a concurrency slot is free. If a layout of X-values is
+    given, its basis is calculated first, or awaited if another call is
+    already calculating it. Cancelling the returned coroutine frees its slot,
+    but a call that has already started on the executor runs to completion.
+    """
+    loop = asyncio.get_running_loop()
+    state = _loop_states.get(loop)
+
+    if state is None:
+        state = _LoopState(max_concurrency)
+        _loop_states[loop] = state
+
+    async with state.semaphore:
+        # Only threads share this process's basis cache.
+        coalesce = executor is None or isinstance(executor, ThreadPoolExecutor)
+
+        if layout is not None and coalesce:
+            await _warm_basis(loop, state, layout)
+
+        return await loop.run_in_executor(executor, func, *args)
+
+
+async def _warm_basis(
+        loop: asyncio.AbstractEventLoop, state: _LoopState,
+        layout: Tuple[Tuple[int, ...], Tuple[int, ...]]) -> None:
+    """
+    Fills the Lagrange basis cache for the given layout of X-values, sharing a
+    single executor call between all concurrent callers. Once the call is
+    done, later callers make a new call, which returns quickly while the
+    basis is still in the cache.
+    """
+    pending = state.pending_bases.get(layout)
+
+    if pending is None:
+        pending = loop.run_in_executor(executor, _calculate_basis, *layout)
+        state.pending_bases[layout] = pending
+
+        def finish(future: asyncio.Future) -> None:
+            state.pending_bases.pop(layout, None)
+
+        pending.add_done_callback(finish)
+
+    # Shielded, so that a cancelled caller does not cancel the calculation for
+    # the other callers waiting on it.
+    await asyncio.shield(pending)
+
+
+def _calculate_basis(
+        x_values: Tuple[int, ...], X_values: Tuple[int, ...]
+        ) -> None:
+    """
+    Calculates the Lagrange basis of the given X-values at each of the given
+    X-values to evaluate, which stores them in the basis cache.
+    """
+    for X in X_values:
+        Lagrange.basis(x_values, PRIME_MODULUS, X)
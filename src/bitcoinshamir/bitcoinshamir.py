@@ -1,13 +1,19 @@
 import os
-from typing import List
-from .exceptions import ChecksumError, ThresholdError
+from hashlib import sha256
+from typing import Dict, Iterable, Iterator, List, Tuple
+from .exceptions import ChecksumError, ThresholdError, WordlistError
+from . import field
 from .enums import Checksum, Language
 from .point import Point
-from .share import Share
+from .share import (
+    Share, SHARE_VERSIONS, GF256_VERSION, WIDE_PRIME_FIELD_VERSION,
+    MAX_THRESHOLDS, MAX_X_VALUES, current_version
+)
 from .encode import Encode
 from .decode import Decode
 from .lagrange import Lagrange
-from .mnemonic import Mnemonic
+from .gf256 import GF256
+from .mnemonic import Mnemonic, MnemonicBatch, wordlist
 
 
 # The field size should be a prime number that is larger than the max value of
@@ -16,28 +22,380 @@ PRIME_MODULUS = 2 ** 256 - 2 ** 32 - 977
 
 
 def create_shares(
-        threshold: int, sharecount: int, mnemonic: Mnemonic
-        ) -> List[Share]:
+        threshold: int, sharecount: int, mnemonic: Mnemonic,
+        version: int = current_version) -> List[Share]:
     """
     Splits a 24-word BIP39 mnemonic into a (k, n) threshold scheme, based on the
     Shamir Secret Sharing (SSS) system. The secret key can be recovered with any
     combination of k number of shares, but no information is revealed about the
     secret key, even with k - 1 shares.
     """
-    if not isinstance(threshold, int):
-        raise TypeError("The threshold argument was not of the int type.")
+    _validate_scheme(threshold, sharecount, version)
 
-    if threshold < 2 or threshold > 17:
-        raise ValueError("The given index argument is out of bounds.")
+    if version == GF256_VERSION:
+        share_sets = create_shares_batch(
+            threshold, sharecount, [mnemonic], version
+        )
+        return share_sets[0]
 
-    if not isinstance(sharecount, int):
-        raise TypeError("The sharecount argument was not of the int type.")
+    return _create_prime_field_shares(
+        threshold, sharecount, mnemonic.seed, mnemonic.checksum, version
+    )
+
+
+def create_shares_batch(
+        threshold: int, sharecount: int,
+        mnemonics: List[Mnemonic] | MnemonicBatch,
+        version: int = current_version) -> List[List[Share]]:
+    """
+    Splits each of the given mnemonics into a (k, n) threshold scheme, as done
+    by create_shares(). The mnemonics may be a list of Mnemonic objects or a
+    MnemonicBatch, which is read directly without creating Mnemonic objects.
+    For version 1 shares, the keys of every mnemonic are joined into one row
+    of bytes, so each X-value is calculated for all of them in a single pass.
+    """
+    _validate_scheme(threshold, sharecount, version)
+
+    if isinstance(mnemonics, list):
+        mnemonics = MnemonicBatch.from_mnemonics(mnemonics)
+    elif not isinstance(mnemonics, MnemonicBatch):
+        message = "The given mnemonics argument was not of the type \
+            List[Mnemonic] or MnemonicBatch."
+        raise TypeError(message)
+
+    seeds = mnemonics.seeds
+    checksums = mnemonics.checksums
+
+    if version != GF256_VERSION:
+        return [
+            _create_prime_field_shares(
+                threshold, sharecount, seeds[i * 32:(i + 1) * 32],
+                checksums[i:i + 1], version
+            )
+            for i in range(len(checksums))
+        ]
+
+    # Row 0 holds the keys at x=0, and row 1 holds the key hashes at x=1. The
+    # rows at x>1 start with random bytes, followed by interpolated bytes.
+    seed_view = memoryview(seeds)
+    hash_row = b"".join(
+        sha256(seed_view[offset:offset + 32]).digest()
+        for offset in range(0, len(seeds), 32)
+    )
+
+    base_rows = [seeds, hash_row]
+    base_rows.extend(os.urandom(len(seeds)) for _ in range(threshold - 2))
+    x_values = tuple(range(threshold))
+
+    share_rows = base_rows[2:]
+    share_rows.extend(
+        GF256.interpolate(x_values, base_rows, x_val)
+        for x_val in range(threshold, sharecount + 2)
+    )
+
+    share_sets = []
+
+    for i in range(len(checksums)):
+        shares = []
+        seed_checksum = checksums[i:i + 1]
+
+        for row_index, row in enumerate(share_rows):
+            y_val = int.from_bytes(row[i * 32:(i + 1) * 32], "big")
+            point = Point(row_index + 2, y_val)
+            share = Share._from_trusted(
+                point, threshold, seed_checksum, version
+            )
+            shares.append(share)
+
+        share_sets.append(shares)
+
+    return share_sets
+
+
+def recover_mnemonic(shares: List[Share]) -> Mnemonic:
+    """
+    Calculates and returns a Mnemonic object based on the given Share objects.
+    Raises an error if the shares are not valid.
+    """
+    _validate_share_set(shares)
+    orignal_key, original_hash = _interpolate_key(shares)
+
+    mnemonic = Mnemonic()
+    mnemonic.seed = orignal_key.to_bytes(32, "big")
+    mnemonic.checksum = original_hash[:1]
+
+    return mnemonic
+
+
+def recover_mnemonic_batch(share_sets: List[List[Share]]) -> List[Mnemonic]:
+    """
+    Calculates and returns a Mnemonic object for each of the given lists of
+    Share objects, as done by recover_mnemonic(). Version 1 share sets with
+    the same X-values are recovered together in a single pass.
+    """
+    if not isinstance(share_sets, list):
+        raise TypeError("The given share_sets argument was not a list object.")
+
+    mnemonics = [None] * len(share_sets)
+    layouts = {}
+
+    for i, shares in enumerate(share_sets):
+        _validate_share_set(shares)
+
+        if shares[0].version != GF256_VERSION:
+            mnemonics[i] = recover_mnemonic(shares)
+            continue
+
+        share_points = sorted(
+            [share.point for share in shares], key=lambda point: point.X
+        )
+        x_values = tuple(point.X for point in share_points)
+        layouts.setdefault(x_values, []).append((i, share_points))
+
+    for x_values, entries in layouts.items():
+        # Row j joins the Y-values of the j-th point of every share set.
+        rows = [
+            b"".join(points[j].Y.to_bytes(32, "big") for _, points in entries)
+            for j in range(len(x_values))
+        ]
+
+        key_row = GF256.interpolate(x_values, rows, 0)
+        hash_row = GF256.interpolate(x_values, rows, 1)
+
+        for entry_index, (i, _) in enumerate(entries):
+            seed = key_row[entry_index * 32:(entry_index + 1) * 32]
+            original_hash = hash_row[entry_index * 32:(entry_index + 1) * 32]
+            recalculated_hash = sha256(seed).digest()
+
+            if original_hash != recalculated_hash:
+                raise ChecksumError(
+                    Checksum.KeyValue, original_hash, recalculated_hash
+                )
+
+            mnemonic = Mnemonic()
+            mnemonic.seed = seed
+            mnemonic.checksum = original_hash[:1]
+            mnemonics[i] = mnemonic
+
+    return mnemonics
+
+
+def reshare(
+        shares: List[Share], threshold: int, sharecount: int
+        ) -> List[Share]:
+    """
+    Recovers the mnemonic of the given Share objects and splits it into a new
+    (k, n) threshold scheme of the same share version. The recovered mnemonic
+    is not kept after the new shares are created. Raises an error if the
+    shares are not valid.
+    """
+    _validate_share_set(shares)
+    version = shares[0].version
+    _validate_scheme(threshold, sharecount, version)
+
+    return create_shares(
+        threshold, sharecount, recover_mnemonic(shares), version
+    )
+
+
+def reshare_batch(
+        share_sets: Iterable[List[Share]], threshold: int, sharecount: int
+        ) -> Iterator[List[Share]]:
+    """
+    Yields a new list of Share objects for each of the given lists of Share
+    objects, as done by reshare(). The share sets are consumed one at a time,
+    so only one recovered mnemonic is held in memory at any point, and share
+    sets with the same X-values reuse the cached interpolation basis.
+    """
+    for shares in share_sets:
+        yield reshare(shares, threshold, sharecount)
+
+
+def extend_shares(
+        shares: List[Share], new_X_values: List[int]
+        ) -> List[Share]:
+    """
+    Returns a new Share object for each of the given X-values, on the same
+    polynomial as the given Share objects. Raises an error if the shares are
+    not valid, if a new X-value is already used by a given share, or if a new
+    X-value is given more than once.
+    """
+    if not isinstance(new_X_values, list):
+        raise TypeError("The given new_X_values argument was not a list.")
+
+    _validate_share_set(shares)
+
+    # The new X-values are checked before any field arithmetic is done.
+    existing_X_values = {share.point.X for share in shares}
+    max_X_value = MAX_X_VALUES[shares[0].version]
+    seen_X_values = set()
+
+    for x_val in new_X_values:
+        if not isinstance(x_val, int):
+            raise TypeError("The given X-value was not of the int type.")
+
+        if x_val < 2 or x_val > max_X_value:
+            raise ValueError("The given X-value is out of bounds.")
+
+        if x_val in seen_X_values:
+            raise ValueError(
+                f"The X-value {x_val} is a duplicate in new_X_values."
+            )
+
+        if x_val in existing_X_values:
+            raise ValueError(f"The X-value {x_val} is already in use.")
+
+        seen_X_values.add(x_val)
+
+    # Verifies that the shares are on the polynomial of a single key.
+    _interpolate_key(shares)
+
+    # The basis for each new X-value is calculated once for the layout of the
+    # given shares, then applied to their Y-values.
+    share_points = sorted(
+        [share.point for share in shares], key=lambda point: point.X
+    )
+    x_values = tuple(point.X for point in share_points)
+    share_y_values = [point.Y for point in share_points]
+    share_rows = [point.Y.to_bytes(32, "big") for point in share_points]
+    first_share = shares[0]
+    new_shares = []
+
+    for x_val in new_X_values:
+        if first_share.version == GF256_VERSION:
+            new_row = GF256.interpolate(x_values, share_rows, x_val)
+            y_val = int.from_bytes(new_row, "big")
+        else:
+            basis = Lagrange.basis(x_values, PRIME_MODULUS, x_val)
+            y_val = field.get_backend().dot(
+                share_y_values, basis, PRIME_MODULUS
+            )
+
+        point = Point(x_val, y_val)
+        share = Share._from_trusted(
+            point, first_share.threshold, first_share.seed_checksum,
+            first_share.version
+        )
+        new_shares.append(share)
+
+    return new_shares
+
+
+def extend_shares_batch(
+        share_sets: Iterable[List[Share]], new_X_values: List[int]
+        ) -> Iterator[List[Share]]:
+    """
+    Yields a list of new Share objects for each of the given lists of Share
+    objects, as done by extend_shares(). Share sets with the same X-values
+    reuse the cached interpolation basis.
+    """
+    for shares in share_sets:
+        yield extend_shares(shares, new_X_values)
 
-    if sharecount < threshold or sharecount > 256:
-        raise ValueError("The given sharecount argument is out of bounds.")
 
+def get_phrase(
+        mnemonic_or_share: Mnemonic | Share, language: Language
+        ) -> List[str]:
+    """
+    Returns a list of words represending a mnemonic phrase or a share phrase,
+    based on the type of the given object.
+    """
+    if not isinstance(language, Language):
+        raise ValueError(f"{language} is not in the language list.")
+
+    if not isinstance(mnemonic_or_share, (Mnemonic, Share)):
+        message = "The given mnemonic_or_share argument was not of the type \
+            Mnemonic or Share."
+        raise TypeError(message)
+
+    word_list = wordlist.get_word_list(language)
+
+    return [word_list[i] for i in mnemonic_or_share.get_word_indices()]
+
+
+def get_phrases(
+        mnemonic_or_share: Mnemonic | Share, languages: List[Language]
+        ) -> Dict[Language, List[str]]:
+    """
+    Returns a dictionary of each given language, mapped to the list of words
+    representing a mnemonic phrase or a share phrase in that language. The word
+    indices are calculated once and reused for every language.
+    """
+    if not isinstance(mnemonic_or_share, (Mnemonic, Share)):
+        message = "The given mnemonic_or_share argument was not of the type \
+            Mnemonic or Share."
+        raise TypeError(message)
+
+    for language in languages:
+        if not isinstance(language, Language):
+            raise ValueError(f"{language} is not in the language list.")
+
+    indices = mnemonic_or_share.get_word_indices()
+    phrases = {}
+
+    for language in languages:
+        word_list = wordlist.get_word_list(language)
+        phrases[language] = [word_list[i] for i in indices]
+
+    return phrases
+
+
+def translate_phrase(
+        phrase: List[str], source: Language, target: Language
+        ) -> List[str]:
+    """
+    Returns the given mnemonic phrase or share phrase in the target language.
+    Every BIP39 word list has the same 2048 indices, so each word is replaced
+    by the word at its index in the target list, without recalculating any
+    checksums. Raises an error if a word is not in the source language.
+    """
+    if not isinstance(phrase, list):
+        raise TypeError("The given phrase was not of the list[str] type.")
+
+    translation_table = wordlist.get_translation_table(source, target)
+
+    try:
+        return [translation_table[word] for word in phrase]
+    except KeyError as error:
+        raise WordlistError(error.args[0], source) from None
+
+
+def translate_phrases(
+        phrases: List[List[str]], source: Language, target: Language
+        ) -> List[List[str]]:
+    """
+    Returns each of the given mnemonic phrases or share phrases in the target
+    language. The translation table is looked up once for the whole batch.
+    """
+    if not isinstance(phrases, list):
+        raise TypeError("The given phrases were not of the list type.")
+
+    translation_table = wordlist.get_translation_table(source, target)
+    translated_phrases = []
+
+    for phrase in phrases:
+        if not isinstance(phrase, list):
+            raise TypeError("The given phrase was not of the list[str] type.")
+
+        try:
+            translated_phrases.append(
+                [translation_table[word] for word in phrase]
+            )
+        except KeyError as error:
+            raise WordlistError(error.args[0], source) from None
+
+    return translated_phrases
+
+
+def _create_prime_field_shares(
+        threshold: int, sharecount: int, seed: bytes, seed_checksum: bytes,
+        version: int) -> List[Share]:
+    """
+    Splits the given mnemonic seed into version 0 or version 2 shares of a
+    (k, n) threshold scheme over the prime field of PRIME_MODULUS.
+    """
     # f(x=0) is the key value.
-    key_num = Decode.mnemonic_key(mnemonic.seed)
+    key_num = Decode.mnemonic_key(seed)
     key_point = Point(0, key_num)
     
     # f(x=1) is the key hash.
@@ -58,7 +416,7 @@ def create_shares(
         random_val = int.from_bytes(os.urandom(32), "big")
 
         point = Point(x_val, random_val)
-        share = Share(point, threshold, mnemonic.checksum)
+        share = Share(point, threshold, seed_checksum, version)
         shares.append(share)
 
     # Calculate the remaining shares using Lagrange interpolation.
@@ -74,16 +432,38 @@ def create_shares(
         y_val = Lagrange.interpolate(base_points, PRIME_MODULUS, x_val)
         
         point = Point(x_val, y_val)
-        share = Share(point, threshold, mnemonic.checksum)
+        share = Share._from_trusted(point, threshold, seed_checksum, version)
         shares.append(share)
 
     return shares
 
 
-def recover_mnemonic(shares: List[Share]) -> Mnemonic:
+def _validate_scheme(threshold: int, sharecount: int, version: int) -> None:
     """
-    Calculates and returns a Mnemonic object based on the given Share objects.
-    Raises an error if the shares are not valid.
+    Raises an error if the given threshold, sharecount, and share version do
+    not make a valid (k, n) threshold scheme.
+    """
+    if version not in SHARE_VERSIONS:
+        raise ValueError(f"The share version {version} is not supported.")
+
+    if not isinstance(threshold, int):
+        raise TypeError("The threshold argument was not of the int type.")
+
+    if threshold < 2 or threshold > MAX_THRESHOLDS[version]:
+        raise ValueError("The given index argument is out of bounds.")
+
+    if not isinstance(sharecount, int):
+        raise TypeError("The sharecount argument was not of the int type.")
+
+    # Share X-values start at 2.
+    if sharecount < threshold or sharecount > MAX_X_VALUES[version] - 1:
+        raise ValueError("The given sharecount argument is out of bounds.")
+
+
+def _validate_share_set(shares: List[Share]) -> None:
+    """
+    Raises an error if the given Share objects do not belong to the same share
+    group and version, or do not meet their threshold.
     """
     if not isinstance(shares, list):
         raise TypeError("The given shares argument was not a list object.")
@@ -100,15 +480,46 @@ def recover_mnemonic(shares: List[Share]) -> Mnemonic:
                 Checksum.ShareGroup, first_seed_checksum, share.seed_checksum
             )
 
+        if share.version != shares[0].version:
+            raise ValueError("The given shares have different versions.")
+
+    # Points with the same X-value can not be interpolated, even if they are
+    # duplicates of the same share.
+    x_values = [share.point.X for share in shares]
+
+    if len(set(x_values)) != len(x_values):
+        raise ValueError("The given shares have duplicate X-values.")
+
     if len(shares) < shares[0].threshold:
         raise ThresholdError(shares[0].threshold, len(shares))
 
-    # Recover mnemonic seed with Lagrange interpolation.
-    share_points = [share.point for share in shares]
 
-    orignal_key = Lagrange.interpolate(share_points, PRIME_MODULUS, 0)
-    original_hash_int = Lagrange.interpolate(share_points, PRIME_MODULUS, 1)
-    original_hash = original_hash_int.to_bytes(32, "big")
+def _interpolate_key(shares: List[Share]) -> Tuple[int, bytes]:
+    """
+    Returns the key and key hash at X-values 0 and 1 of the polynomial of the
+    given validated Share objects. Raises an error if the key hash does not
+    match the key, as the shares are not all from the same key.
+    """
+    # Recover mnemonic seed with Lagrange interpolation. The points are sorted
+    # by X-value, so that shares given in any order use the same cached basis.
+    share_points = sorted(
+        [share.point for share in shares], key=lambda point: point.X
+    )
+
+    if shares[0].version == GF256_VERSION:
+        x_values = tuple(point.X for point in share_points)
+        rows = [point.Y.to_bytes(32, "big") for point in share_points]
+        orignal_key = int.from_bytes(
+            GF256.interpolate(x_values, rows, 0), "big"
+        )
+        original_hash = GF256.interpolate(x_values, rows, 1)
+    else:
+        orignal_key = Lagrange.interpolate(share_points, PRIME_MODULUS, 0)
+        original_hash_int = Lagrange.interpolate(
+            share_points, PRIME_MODULUS, 1
+        )
+        original_hash = original_hash_int.to_bytes(32, "big")
+
     recalculated_hash = Encode.mnemonic_hash(orignal_key)
 
     if original_hash != recalculated_hash:
@@ -116,25 +527,4 @@ def recover_mnemonic(shares: List[Share]) -> Mnemonic:
             Checksum.KeyValue, original_hash, recalculated_hash
         )
 
-    mnemonic = Mnemonic()
-    mnemonic.seed = orignal_key.to_bytes(32, "big")
-    mnemonic.checksum = original_hash[:1]
-
-    return mnemonic
-
-
-def get_phrase(
-        mnemonic_or_share: Mnemonic | Share, language: Language
-        ) -> List[str]:
-    """
-    Returns a list of words represending a mnemonic phrase or a share phrase,
-    based on the type of the given object.
-    """
-    if isinstance(mnemonic_or_share, Mnemonic):
-        return [mnemonic_or_share.get_word(i, language) for i in range(24)]
-    elif isinstance(mnemonic_or_share, Share):
-        return [mnemonic_or_share.get_word(i, language) for i in range(27)]
-    else:
-        message = "The given mnemonic_or_share argument was not of the type \
-            Mnemonic or Share."
-        raise TypeError(message)
+    return orignal_key, original_hash
@@ -0,0 +1,287 @@
+import hmac
+import threading
+import time
+from collections import OrderedDict, deque
+from hashlib import sha256
+from typing import Callable, List, Optional
+from .bitcoinshamir import recover_mnemonic
+from .derivation import get_seed_fingerprint
+from .enums import Language
+from .mnemonic import Mnemonic
+from .share import Share
+
+
+class _CacheEntry:
+    """
+    Holds the result of one recovered share set, and when it expires.
+    """
+    def __init__(
+            self, fingerprint: bytes, key: Optional[bytearray],
+            expires: float) -> None:
+        """
+        Initializes a new instance of the _CacheEntry class.
+        """
+        self.fingerprint = fingerprint
+        self.key = key
+        self.expires = expires
+
+
+    def zeroize(self) -> None:
+        """
+        Overwrites the stored mnemonic bytes, if any, with zeros.
+        """
+        if self.key is not None:
+            self.key[:] = bytes(len(self.key))
+            self.key = None
+
+
+class RecoveryCache:
+    """
+    RecoveryCache class for skipping the recovery of share sets that were
+    recovered recently. Each share set is keyed by the sha256 hash of its
+    sorted share bytes, so the same shares in any order are a cache hit, and
+    a changed share is a cache miss. Entries expire after the time to live,
+    and the least recently used entry is evicted when the cache is full.
+
+    The fingerprint of each recovered mnemonic is the given fingerprint
+    function of its BIP39 seed, derived with the given passphrase and phrase
+    language, so by default it matches the fingerprints of
+    derive_fingerprints(). Only the fingerprint is stored by default. If
+    store_keys is set, the 33 mnemonic bytes are also stored in a bytearray,
+    which is overwritten with zeros when its entry is evicted, expires, or is
+    cleared. Mnemonic objects returned by recover() are copies, and are not
+    zeroized.
+    """
+    def __init__(
+            self, max_size: int = 1024, ttl: float = 300.0,
+            store_keys: bool = False, passphrase: str = "",
+            language: Language = Language.English,
+            fingerprint: Callable[[bytes], bytes] = get_seed_fingerprint,
+            clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initializes a new, empty instance of the RecoveryCache class, holding
+        at most the given number of share sets for the given seconds each.
+        """
+        if not isinstance(max_size, int):
+            raise TypeError("The max_size argument was not of the int type.")
+
+        if max_size < 1:
+            raise ValueError("The given max_size argument is out of bounds.")
+
+        if not isinstance(ttl, (int, float)):
+            raise TypeError("The ttl argument was not of the float type.")
+
+        if ttl <= 0:
+            raise ValueError("The given ttl argument is out of bounds.")
+
+        if not isinstance(passphrase, str):
+            raise TypeError("The passphrase argument was not of the str type.")
+
+        if not isinstance(language, Language):
+            raise ValueError(f"{language} is not in the language list.")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.store_keys = store_keys
+        self.passphrase = passphrase
+        self.language = language
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._expiry_queue = deque()
+        self._lock = threading.Lock()
+
+
+    def get_fingerprint(self, shares: List[Share]) -> bytes:
+        """
+        Returns the fingerprint of the seed of the mnemonic recovered from the
+        given shares. The shares are only recovered, and the seed derived, if
+        they are not in the cache. Raises an error if the shares are not valid.
+        """
+        cache_key = _get_cache_key(shares)
+
+        with self._lock:
+            entry = self._get_entry(cache_key)
+
+            if entry is not None:
+                return entry.fingerprint
+
+        mnemonic = recover_mnemonic(shares)
+
+        return self._add_entry(cache_key, mnemonic)
+
+
+    def check(self, shares: List[Share], fingerprint: bytes) -> bool:
+        """
+        Returns true if the mnemonic recovered from the given shares has the
+        given seed fingerprint. Raises an error if the shares are not
+        valid.
+        """
+        return hmac.compare_digest(self.get_fingerprint(shares), fingerprint)
+
+
+    def recover(self, shares: List[Share]) -> Mnemonic:
+        """
+        Returns the mnemonic recovered from the given shares. The shares are
+        only recovered if their mnemonic bytes are stored in the cache, which
+        needs store_keys to be set. Raises an error if the shares are not
+        valid.
+        """
+        cache_key = _get_cache_key(shares)
+
+        with self._lock:
+            entry = self._get_entry(cache_key, needs_key=True)
+
+            if entry is not None:
+                mnemonic = Mnemonic()
+                mnemonic.seed = bytes(entry.key[:32])
+                mnemonic.checksum = bytes(entry.key[32:])
+
+                return mnemonic
+
+        mnemonic = recover_mnemonic(shares)
+        self._add_entry(cache_key, mnemonic)
+
+        return mnemonic
+
+
+    def purge_expired(self) -> None:
+        """
+        Removes every expired entry from the cache, zeroizing any stored
+        mnemonic bytes. This is also done on every cache lookup.
+        """
+        with self._lock:
+            self._purge_expired()
+
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache, zeroizing any stored mnemonic
+        bytes.
+        """
+        with self._lock:
+            for entry in self._entries.values():
+                entry.zeroize()
+
+            self._entries.clear()
+            self._expiry_queue.clear()
+
+
+    def __len__(self) -> int:
+        """
+        Returns the number of share sets in the cache.
+        """
+        return len(self._entries)
+
+
+    def _get_entry(
+            self, cache_key: bytes, needs_key: bool = False
+            ) -> Optional[_CacheEntry]:
+        """
+        Returns the unexpired entry of the given cache key, and counts a cache
+        hit or miss. Entries without stored mnemonic bytes are a miss if
+        needs_key is set. The lock must be held.
+        """
+        self._purge_expired()
+        entry = self._entries.get(cache_key)
+
+        if entry is None or (needs_key and entry.key is None):
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(cache_key)
+        self.hits += 1
+
+        return entry
+
+
+    def _add_entry(self, cache_key: bytes, mnemonic: Mnemonic) -> bytes:
+        """
+        Adds the recovered mnemonic to the cache under the given cache key,
+        evicting the least recently used entries to stay within the size
+        bound, and returns its seed fingerprint.
+        """
+        seed = mnemonic.to_seed(self.passphrase, self.language)
+        fingerprint = self.fingerprint(seed)
+        key = None
+
+        if self.store_keys:
+            key = bytearray(mnemonic.seed + mnemonic.checksum)
+
+        with self._lock:
+            expires = self._clock() + self.ttl
+            old_entry = self._entries.pop(cache_key, None)
+
+            if old_entry is not None:
+                old_entry.zeroize()
+
+            while len(self._entries) >= self.max_size:
+                _, entry = self._entries.popitem(last=False)
+                entry.zeroize()
+
+            self._entries[cache_key] = _CacheEntry(fingerprint, key, expires)
+            self._expiry_queue.append((expires, cache_key))
+
+            # Evicted and replaced entries leave stale items in the queue, so
+            # it is compacted to the live entries when it outgrows the cache.
+            if len(self._expiry_queue) > 2 * self.max_size:
+                self._compact_expiry_queue()
+
+        return fingerprint
+
+
+    def _purge_expired(self) -> None:
+        """
+        Removes every expired entry from the cache. The lock must be held.
+        """
+        # Entries expire in the order they were added, so the expired ones
+        # are at the front of the queue. Entries that were already evicted or
+        # replaced are skipped.
+        now = self._clock()
+
+        while self._expiry_queue and self._expiry_queue[0][0] <= now:
+            expires, cache_key = self._expiry_queue.popleft()
+            entry = self._entries.get(cache_key)
+
+            if entry is not None and entry.expires == expires:
+                del self._entries[cache_key]
+                entry.zeroize()
+
+
+    def _compact_expiry_queue(self) -> None:
+        """
+        Removes the items of evicted and replaced entries from the expiry
+        queue, keeping the rest in order. The lock must be held.
+        """
+        live_items = []
+
+        for expires, cache_key in self._expiry_queue:
+            entry = self._entries.get(cache_key)
+
+            if entry is not None and entry.expires == expires:
+                live_items.append((expires, cache_key))
+
+        self._expiry_queue = deque(live_items)
+
+
+def _get_cache_key(shares: List[Share]) -> bytes:
+    """
+    Returns the sha256 hash of the sorted share bytes of the given shares.
+    """
+    if not isinstance(shares, list):
+        raise TypeError("The given shares argument was not a list object.")
+
+    share_bins = []
+
+    for share in shares:
+        if not isinstance(share, Share):
+            message = "The shares argument was not of the type List[Share]."
+            raise TypeError(message)
+
+        share_bins.append(share.to_bytes())
+
+    share_bins.sort()
+
+    return sha256(b"".join(share_bins)).digest()
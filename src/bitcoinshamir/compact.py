@@ -0,0 +1,344 @@
+from hashlib import sha256
+from typing import Iterable, List
+from .enums import Checksum, Language
+from .exceptions import ChecksumError
+from .mnemonic import Mnemonic, MnemonicBatch, _phrase_int, wordlist
+from .share import Share
+
+
+# Compact text is a lowercase prefix, ending with "1" as a separator, followed
+# by the base32 form of the payload bytes and a checksum of the prefix and
+# payload. The checksum sizes are chosen so that each text needs no base32
+# padding:
+# Share:    "bss1" + base32(37 share bytes + 3 checksum bytes), 68 characters
+# Version 2 share: "bsw1" + base32(38 share bytes + 2 checksum bytes), 68 chars
+# Mnemonic: "bsm1" + base32(33 mnemonic bytes + 2 checksum bytes), 60 chars
+SHARE_PREFIX = "bss1"
+WIDE_SHARE_PREFIX = "bsw1"
+MNEMONIC_PREFIX = "bsm1"
+SHARE_CHECKSUM_SIZE = 3
+WIDE_SHARE_CHECKSUM_SIZE = 2
+MNEMONIC_CHECKSUM_SIZE = 2
+
+# The RFC 4648 base32 alphabet, in lowercase. Text is encoded 10 bits, or 2
+# characters, at a time from a table, and decoded by translating it to the
+# digits of int(text, 32), which is much faster than base64.b32decode().
+BASE32_ALPHABET = "abcdefghijklmnopqrstuvwxyz234567"
+
+_encode_table = [a + b for a in BASE32_ALPHABET for b in BASE32_ALPHABET]
+_decode_table = str.maketrans(
+    BASE32_ALPHABET + BASE32_ALPHABET.upper(),
+    "0123456789abcdefghijklmnopqrstuv" * 2,
+    "0189"
+)
+
+
+def encode_share(share: Share) -> str:
+    """
+    Returns the compact text form of the given share.
+    """
+    if not isinstance(share, Share):
+        raise TypeError("The given share argument was not of the Share type.")
+
+    return _encode_share_bytes(share.to_bytes())
+
+
+def decode_share(text: str) -> Share:
+    """
+    Returns the share of the given compact text. Raises an error if the text
+    is not a compact share, or either checksum is not valid.
+    """
+    return Share.from_bytes(_decode_share_bytes(text))
+
+
+def encode_shares(shares: Iterable[Share]) -> List[str]:
+    """
+    Returns the compact text form of each of the given shares.
+    """
+    return [encode_share(share) for share in shares]
+
+
+def decode_shares(texts: Iterable[str]) -> List[Share]:
+    """
+    Returns the share of each of the given compact texts.
+    """
+    return [decode_share(text) for text in texts]
+
+
+def encode_mnemonic(mnemonic: Mnemonic) -> str:
+    """
+    Returns the compact text form of the given mnemonic.
+    """
+    if not isinstance(mnemonic, Mnemonic):
+        message = "The given mnemonic argument was not of the Mnemonic type."
+        raise TypeError(message)
+
+    mnemonic_bytes = mnemonic.seed + mnemonic.checksum
+
+    return _encode(MNEMONIC_PREFIX, mnemonic_bytes, MNEMONIC_CHECKSUM_SIZE)
+
+
+def decode_mnemonic(text: str) -> Mnemonic:
+    """
+    Returns the mnemonic of the given compact text. Raises an error if the
+    text is not a compact mnemonic, or either checksum is not valid.
+    """
+    mnemonic_bytes = _decode(
+        text, MNEMONIC_PREFIX, 33, MNEMONIC_CHECKSUM_SIZE,
+        Checksum.CompactMnemonic
+    )
+
+    return Mnemonic.from_bytes(mnemonic_bytes)
+
+
+def encode_mnemonics(
+        mnemonics: Iterable[Mnemonic] | MnemonicBatch
+        ) -> List[str]:
+    """
+    Returns the compact text form of each of the given mnemonics. A
+    MnemonicBatch is read directly without creating Mnemonic objects.
+    """
+    if not isinstance(mnemonics, MnemonicBatch):
+        return [encode_mnemonic(mnemonic) for mnemonic in mnemonics]
+
+    seeds = mnemonics.seeds
+    checksums = mnemonics.checksums
+
+    return [
+        _encode(
+            MNEMONIC_PREFIX, seeds[i * 32:(i + 1) * 32] + checksums[i:i + 1],
+            MNEMONIC_CHECKSUM_SIZE
+        )
+        for i in range(len(checksums))
+    ]
+
+
+def decode_mnemonics(texts: Iterable[str]) -> MnemonicBatch:
+    """
+    Returns the mnemonics of the given compact texts as a single
+    MnemonicBatch, without creating Mnemonic objects.
+    """
+    seeds = []
+    checksums = []
+
+    for text in texts:
+        mnemonic_bytes = _decode(
+            text, MNEMONIC_PREFIX, 33, MNEMONIC_CHECKSUM_SIZE,
+            Checksum.CompactMnemonic
+        )
+        _verify_mnemonic_bytes(mnemonic_bytes)
+        seeds.append(mnemonic_bytes[:32])
+        checksums.append(mnemonic_bytes[32:])
+
+    return MnemonicBatch(b"".join(seeds), b"".join(checksums))
+
+
+def phrase_to_compact(phrase: List[str], language: Language) -> str:
+    """
+    Returns the compact text form of the given 27-word share phrase, 28-word
+    version 2 share phrase, or 24-word mnemonic phrase, without creating a
+    Share or Mnemonic object.
+    Raises an error if a word is not in the given language's word list, or
+    the phrase checksum is not valid.
+    """
+    if not isinstance(language, Language):
+        raise ValueError(f"{language} is not in the language list.")
+
+    if not isinstance(phrase, list):
+        raise TypeError("The given phrase was not of the list[str] type.")
+
+    if len(phrase) == 27:
+        # Remove the extra bit of the 27th word, which spills over the 37
+        # share bytes. Decoding verifies the share checksum and the decoded
+        # values.
+        share_int = _phrase_int(phrase, language) >> 1
+        Share._decode_share_int(share_int)
+
+        return _encode_share_bytes(share_int.to_bytes(37, "big"))
+
+    if len(phrase) == 28:
+        # Remove the 4 extra bits of the 28th word, which spill over the 38
+        # share bytes.
+        share_int = _phrase_int(phrase, language) >> 4
+        Share._decode_wide_share_int(share_int)
+
+        return _encode_share_bytes(share_int.to_bytes(38, "big"))
+
+    if len(phrase) == 24:
+        mnemonic_int = _phrase_int(phrase, language)
+        mnemonic_bytes = mnemonic_int.to_bytes(33, "big")
+        _verify_mnemonic_bytes(mnemonic_bytes)
+
+        return _encode(
+            MNEMONIC_PREFIX, mnemonic_bytes, MNEMONIC_CHECKSUM_SIZE
+        )
+
+    raise ValueError("The given phrase did not have 24, 27, or 28 words.")
+
+
+def compact_to_phrase(text: str, language: Language) -> List[str]:
+    """
+    Returns the share phrase or mnemonic phrase in the given language of the
+    given compact text, without creating a Share or Mnemonic object. Raises
+    an error if the text is not compact text, or a checksum is not valid.
+    """
+    if not isinstance(language, Language):
+        raise ValueError(f"{language} is not in the language list.")
+
+    if not isinstance(text, str):
+        raise TypeError("The given text argument was not of the str type.")
+
+    if text[:len(MNEMONIC_PREFIX)].lower() != MNEMONIC_PREFIX:
+        share_bytes = _decode_share_bytes(text)
+        share_int = int.from_bytes(share_bytes, "big")
+
+        if len(share_bytes) == 38:
+            phrase_int = Share._decode_wide_share_int(share_int)[4]
+            word_count = 28
+        else:
+            phrase_int = Share._decode_share_int(share_int)[4]
+            word_count = 27
+    else:
+        mnemonic_bytes = _decode(
+            text, MNEMONIC_PREFIX, 33, MNEMONIC_CHECKSUM_SIZE,
+            Checksum.CompactMnemonic
+        )
+        _verify_mnemonic_bytes(mnemonic_bytes)
+        phrase_int = int.from_bytes(mnemonic_bytes, "big")
+        word_count = 24
+
+    word_list = wordlist.get_word_list(language)
+    word_bitmask = 0b1111_1111_111
+
+    # The first word is the left-most 11 bits of the phrase integer.
+    return [
+        word_list[(phrase_int >> (word_count_right_side * 11)) & word_bitmask]
+        for word_count_right_side in range(word_count - 1, -1, -1)
+    ]
+
+
+def phrases_to_compact(
+        phrases: Iterable[List[str]], language: Language
+        ) -> List[str]:
+    """
+    Returns the compact text form of each of the given phrases.
+    """
+    return [phrase_to_compact(phrase, language) for phrase in phrases]
+
+
+def compact_to_phrases(
+        texts: Iterable[str], language: Language
+        ) -> List[List[str]]:
+    """
+    Returns the phrase in the given language of each of the given compact
+    texts.
+    """
+    return [compact_to_phrase(text, language) for text in texts]
+
+
+def _encode_share_bytes(share_bytes: bytes) -> str:
+    """
+    Returns the compact text of the given 37 share bytes, or 38 bytes of a
+    version 2 share.
+    """
+    if len(share_bytes) == 38:
+        return _encode(WIDE_SHARE_PREFIX, share_bytes, WIDE_SHARE_CHECKSUM_SIZE)
+
+    return _encode(SHARE_PREFIX, share_bytes, SHARE_CHECKSUM_SIZE)
+
+
+def _decode_share_bytes(text: str) -> bytes:
+    """
+    Returns the 37 share bytes, or 38 bytes of a version 2 share, of the given
+    compact text. Raises an error if the text is not a compact share, or its
+    checksum is not valid.
+    """
+    if isinstance(text, str) and text[:4].lower() == WIDE_SHARE_PREFIX:
+        return _decode(
+            text, WIDE_SHARE_PREFIX, 38, WIDE_SHARE_CHECKSUM_SIZE,
+            Checksum.CompactWideShare
+        )
+
+    return _decode(
+        text, SHARE_PREFIX, 37, SHARE_CHECKSUM_SIZE, Checksum.CompactShare
+    )
+
+
+def _encode(prefix: str, payload: bytes, checksum_size: int) -> str:
+    """
+    Returns the compact text of the given prefix and payload bytes.
+    """
+    checksum = _checksum(prefix, payload, checksum_size)
+    data = payload + checksum
+    data_int = int.from_bytes(data, "big")
+
+    # Every 5 bytes are 8 characters, so the data is a whole number of 10-bit
+    # pairs of characters.
+    shifts = range(len(data) * 8 - 10, -10, -10)
+    body = "".join([
+        _encode_table[(data_int >> shift) & 0x3FF] for shift in shifts
+    ])
+
+    return prefix + body
+
+
+def _decode(
+        text: str, prefix: str, payload_size: int, checksum_size: int,
+        checksum_type: Checksum) -> bytes:
+    """
+    Returns the payload bytes of the given compact text. Raises an error if
+    the text does not have the given prefix and payload size, or its checksum
+    is not valid.
+    """
+    if not isinstance(text, str):
+        raise TypeError("The given text argument was not of the str type.")
+
+    if text[:len(prefix)].lower() != prefix:
+        raise ValueError(f"The given text does not start with '{prefix}'.")
+
+    data_size = payload_size + checksum_size
+    body = text[len(prefix):]
+
+    if len(body) * 5 != data_size * 8:
+        raise ValueError("The given text is not the expected length.")
+
+    # Characters outside of the alphabet are either not alphanumeric, or are
+    # removed by the translation.
+    digits = body.translate(_decode_table)
+
+    if len(digits) != len(body) or not body.isascii() or not body.isalnum():
+        raise ValueError("The given text is not valid base32.")
+
+    data = int(digits, 32).to_bytes(data_size, "big")
+
+    payload = data[:payload_size]
+    given_checksum = data[payload_size:]
+    recalculated_checksum = _checksum(prefix, payload, checksum_size)
+
+    if given_checksum != recalculated_checksum:
+        raise ChecksumError(
+            checksum_type, given_checksum, recalculated_checksum
+        )
+
+    return payload
+
+
+def _checksum(prefix: str, payload: bytes, checksum_size: int) -> bytes:
+    """
+    Returns the checksum of the given prefix and payload bytes.
+    """
+    return sha256(prefix.encode("ascii") + payload).digest()[:checksum_size]
+
+
+def _verify_mnemonic_bytes(mnemonic_bytes: bytes) -> None:
+    """
+    Raises an error if the checksum of the given 33 mnemonic bytes is not
+    valid.
+    """
+    given_checksum = mnemonic_bytes[32:]
+    recalculated_checksum = sha256(mnemonic_bytes[:32]).digest()[:1]
+
+    if given_checksum != recalculated_checksum:
+        raise ChecksumError(
+            Checksum.Mnemonic, given_checksum, recalculated_checksum
+        )
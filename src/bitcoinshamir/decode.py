@@ -24,6 +24,16 @@ class Decode:
         return decoded_threshold + 2
 
 
+    @staticmethod
+    def wide_share_threshold(encoded_threshold: int) -> int:
+        """
+        Returns the actual threshold of a version 2 Share object based on the
+        given encoded threshold byte.
+        """
+        # The decoded threshold starts at 2.
+        return encoded_threshold + 2
+
+
     @staticmethod
     def share_version(encoded_version: int) -> int:
         """
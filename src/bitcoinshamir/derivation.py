@@ -0,0 +1,183 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from typing import Callable, Iterable, Iterator, List, Optional, Union
+from .enums import Language
+from .mnemonic import Mnemonic, MnemonicBatch
+
+
+# Mnemonics are sent to the worker processes in chunks of this many, as the
+# joined 33-byte form of each mnemonic, so each task costs one small pickle.
+DEFAULT_CHUNK_SIZE = 64
+
+# Number of chunks in flight per worker process. Results are yielded in order
+# as they finish, so memory use is bounded for any number of mnemonics.
+CHUNKS_PER_PROCESS = 2
+
+
+def get_seed_fingerprint(seed: bytes) -> bytes:
+    """
+    Returns the 8-byte fingerprint of the given BIP39 seed, which is the start
+    of its sha256 hash. The fingerprint can be kept with vault records to
+    verify a recovered mnemonic without storing the seed.
+    """
+    return sha256(seed).digest()[:8]
+
+
+def derive_seeds(
+        mnemonics: Union[Iterable[Mnemonic], MnemonicBatch],
+        passphrase: str = "", language: Language = Language.English,
+        processes: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yields the 64-byte BIP39 seed of each of the given mnemonics, in order,
+    derived with the given passphrase and phrase language. The derivations
+    run across a pool of the given number of processes, which defaults to the
+    number of CPUs. A single process derives every seed in this process.
+    """
+    return _derive(
+        mnemonics, passphrase, language, None, processes, chunk_size
+    )
+
+
+def derive_fingerprints(
+        mnemonics: Union[Iterable[Mnemonic], MnemonicBatch],
+        passphrase: str = "", language: Language = Language.English,
+        fingerprint: Callable[[bytes], bytes] = get_seed_fingerprint,
+        processes: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yields the fingerprint of the BIP39 seed of each of the given mnemonics,
+    in order. Only the fingerprints are sent back from the worker processes.
+    The fingerprint function must be defined at module level, so that it can
+    be sent to the worker processes.
+    """
+    return _derive(
+        mnemonics, passphrase, language, fingerprint, processes, chunk_size
+    )
+
+
+def _derive(
+        mnemonics: Union[Iterable[Mnemonic], MnemonicBatch], passphrase: str,
+        language: Language, fingerprint: Optional[Callable[[bytes], bytes]],
+        processes: Optional[int], chunk_size: int) -> Iterator[bytes]:
+    """
+    Validates the arguments, and returns a generator of the derived seeds, or
+    of their fingerprints if a fingerprint function is given.
+    """
+    if not isinstance(passphrase, str):
+        raise TypeError("The passphrase argument was not of the str type.")
+
+    if not isinstance(language, Language):
+        raise ValueError(f"{language} is not in the language list.")
+
+    if processes is not None:
+        if not isinstance(processes, int):
+            raise TypeError("The processes argument was not of the int type.")
+
+        if processes < 1:
+            raise ValueError("The given processes argument is out of bounds.")
+
+    if not isinstance(chunk_size, int):
+        raise TypeError("The chunk_size argument was not of the int type.")
+
+    if chunk_size < 1:
+        raise ValueError("The given chunk_size argument is out of bounds.")
+
+    chunks = _chunk_mnemonics(mnemonics, chunk_size)
+
+    if processes == 1:
+        return _derive_inline(chunks, passphrase, language, fingerprint)
+
+    return _derive_pooled(chunks, passphrase, language, fingerprint, processes)
+
+
+def _derive_inline(
+        chunks: Iterator[bytes], passphrase: str, language: Language,
+        fingerprint: Optional[Callable[[bytes], bytes]]) -> Iterator[bytes]:
+    """
+    Yields the result of each mnemonic, derived in this process.
+    """
+    for chunk in chunks:
+        yield from _derive_chunk(chunk, passphrase, language, fingerprint)
+
+
+def _derive_pooled(
+        chunks: Iterator[bytes], passphrase: str, language: Language,
+        fingerprint: Optional[Callable[[bytes], bytes]],
+        processes: Optional[int]) -> Iterator[bytes]:
+    """
+    Yields the result of each mnemonic, derived across a process pool. Only a
+    bounded number of chunks is submitted ahead of the results being read.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    max_pending = processes * CHUNKS_PER_PROCESS
+
+    with ProcessPoolExecutor(processes) as pool:
+        pending = deque()
+
+        for chunk in chunks:
+            pending.append(pool.submit(
+                _derive_chunk, chunk, passphrase, language, fingerprint
+            ))
+
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _derive_chunk(
+        chunk: bytes, passphrase: str, language: Language,
+        fingerprint: Optional[Callable[[bytes], bytes]]) -> List[bytes]:
+    """
+    Returns the seed, or its fingerprint, of each mnemonic in the given chunk
+    of joined 33-byte mnemonics.
+    """
+    results = []
+
+    for offset in range(0, len(chunk), 33):
+        mnemonic = Mnemonic()
+        mnemonic.seed = chunk[offset:offset + 32]
+        mnemonic.checksum = chunk[offset + 32:offset + 33]
+        seed = mnemonic.to_seed(passphrase, language)
+        results.append(seed if fingerprint is None else fingerprint(seed))
+
+    return results
+
+
+def _chunk_mnemonics(
+        mnemonics: Union[Iterable[Mnemonic], MnemonicBatch], chunk_size: int
+        ) -> Iterator[bytes]:
+    """
+    Yields the given mnemonics in chunks of joined 33-byte mnemonics.
+    """
+    if isinstance(mnemonics, MnemonicBatch):
+        for start in range(0, len(mnemonics), chunk_size):
+            end = min(start + chunk_size, len(mnemonics))
+            yield b"".join(
+                mnemonics.seeds[index * 32:(index + 1) * 32]
+                + mnemonics.checksums[index:index + 1]
+                for index in range(start, end)
+            )
+
+        return
+
+    chunk = []
+
+    for mnemonic in mnemonics:
+        if not isinstance(mnemonic, Mnemonic):
+            raise TypeError("The given mnemonics were not Mnemonic objects.")
+
+        chunk.append(mnemonic.seed + mnemonic.checksum)
+
+        if len(chunk) == chunk_size:
+            yield b"".join(chunk)
+            chunk = []
+
+    if chunk:
+        yield b"".join(chunk)
@@ -1,3 +1,4 @@
+from .enums import Checksum
 from .exceptions import ChecksumError
 from hashlib import sha256
 
@@ -31,6 +32,17 @@ class Encode:
         return encoded_threshold
 
 
+    @staticmethod
+    def wide_share_threshold(unencoded_threshold: int) -> int:
+        """
+        Returns the given threshold value as the encoded value in a version 2
+        Share object, which has a byte of its own.
+        """
+        # The actual threshold starts at 2, so the encoded version is 2 less
+        # than the given value.
+        return unencoded_threshold - 2
+
+
     @staticmethod
     def share_version(unencoded_version: int) -> int:
         """
@@ -91,7 +103,9 @@ class Encode:
         calculated_checksum = sha256(seed).digest()[:1]
 
         if checksum != calculated_checksum:
-            raise ChecksumError(checksum, calculated_checksum)
+            raise ChecksumError(
+                Checksum.Mnemonic, checksum, calculated_checksum
+            )
             
         return mnemonic_bytes
 
@@ -108,7 +122,9 @@ class Encode:
         calculated_checksum = sha256(seed).digest()[:1]
 
         if checksum != calculated_checksum:
-            raise ChecksumError(checksum, calculated_checksum)
+            raise ChecksumError(
+                Checksum.Mnemonic, checksum, calculated_checksum
+            )
 
         return seed
 
@@ -125,7 +141,9 @@ class Encode:
         calculated_checksum = sha256(seed).digest()[:1]
 
         if checksum != calculated_checksum:
-            raise ChecksumError(checksum, calculated_checksum)
+            raise ChecksumError(
+                Checksum.Mnemonic, checksum, calculated_checksum
+            )
 
         return checksum
 
@@ -18,4 +18,16 @@ class Checksum(str, Enum):
     Mnemonic = "Mnemonic 8-bit Checksum"
     KeyValue = "Mnemonic 32-byte Checksum"
     ShareGroup = "Share Group 8-bit Checksum"
-    Share = "Share Key 16-bit Checksum"
\ No newline at end of file
+    Share = "Share Key 16-bit Checksum"
+    WideShare = "Version 2 Share Key 16-bit Checksum"
+    StreamChunk = "Share Stream Chunk 32-bit Checksum"
+    StreamData = "Share Stream Data 32-byte Checksum"
+    CompactShare = "Compact Share 24-bit Checksum"
+    CompactWideShare = "Compact Version 2 Share 16-bit Checksum"
+    CompactMnemonic = "Compact Mnemonic 16-bit Checksum"
+
+
+class ShareStatus(str, Enum):
+    Added = "Added"
+    Duplicate = "Duplicate"
+    Conflict = "Conflict"
@@ -1,3 +1,4 @@
+from typing import List
 from .enums import Checksum, Language
 
 class ChecksumError(Exception):
@@ -59,4 +60,17 @@ class WordlistError(Exception):
 
 
     def __str__(self) -> str:
-        return f"'{self.word}' not found in {self.language} word list."
\ No newline at end of file
+        return f"'{self.word}' not found in {self.language} word list."
+
+
+class LoadTestError(Exception):
+    """
+    Exception raised when a load test exceeds one of its configured ceilings.
+    """
+    def __init__(self, failures: List[str], *args: object) -> None:
+        super().__init__(*args)
+        self.failures = failures
+
+
+    def __str__(self) -> str:
+        return "Load test ceilings exceeded:\n" + "\n".join(self.failures)
@@ -0,0 +1,206 @@
+import os
+import timeit
+from typing import Dict, List, Sequence
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+
+class PythonBackend:
+    """
+    Field arithmetic backend using Python ints. This backend is always
+    available.
+    """
+    name = "python"
+
+    @staticmethod
+    def mul(a: int, b: int, modulus: int) -> int:
+        """
+        Returns the product of the given values over the finite field of the
+        given modulus.
+        """
+        return a * b % modulus
+
+
+    @staticmethod
+    def inverse(value: int, modulus: int) -> int:
+        """
+        Returns the multiplicitive inverse of the given value over the finite
+        field of the given modulus. Raises an error if the value is 0.
+        """
+        return pow(value, -1, modulus)
+
+
+    @staticmethod
+    def batch_inverse(values: Sequence[int], modulus: int) -> List[int]:
+        """
+        Returns the multiplicitive inverse of each of the given values over the
+        finite field of the given modulus, using a single inversion. Raises an
+        error if any value is 0.
+        """
+        # Montgomery's trick: invert the product of all values, then peel off
+        # each inverse with the running products.
+        prefix_products = []
+        cumulative_product = 1
+
+        for value in values:
+            prefix_products.append(cumulative_product)
+            cumulative_product = cumulative_product * value % modulus
+
+        inverse_product = pow(cumulative_product, -1, modulus)
+        inverses = [0] * len(values)
+
+        for i in range(len(values) - 1, -1, -1):
+            inverses[i] = inverse_product * prefix_products[i] % modulus
+            inverse_product = inverse_product * values[i] % modulus
+
+        return inverses
+
+
+    @staticmethod
+    def dot(a: Sequence[int], b: Sequence[int], modulus: int) -> int:
+        """
+        Returns the sum of the products of the given pairs of values over the
+        finite field of the given modulus.
+        """
+        return sum(x * y for x, y in zip(a, b)) % modulus
+
+
+class Gmpy2Backend:
+    """
+    Field arithmetic backend using the gmpy2 library. Values are returned as
+    Python ints, so both backends can be used interchangeably.
+    """
+    name = "gmpy2"
+
+    @staticmethod
+    def mul(a: int, b: int, modulus: int) -> int:
+        """
+        Returns the product of the given values over the finite field of the
+        given modulus.
+        """
+        return int(gmpy2.mpz(a) * b % modulus)
+
+
+    @staticmethod
+    def inverse(value: int, modulus: int) -> int:
+        """
+        Returns the multiplicitive inverse of the given value over the finite
+        field of the given modulus. Raises an error if the value is 0.
+        """
+        if value % modulus == 0:
+            raise ValueError("base is not invertible for the given modulus")
+
+        return int(gmpy2.invert(value, modulus))
+
+
+    @staticmethod
+    def batch_inverse(values: Sequence[int], modulus: int) -> List[int]:
+        """
+        Returns the multiplicitive inverse of each of the given values over the
+        finite field of the given modulus, using a single inversion. Raises an
+        error if any value is 0.
+        """
+        mpz_modulus = gmpy2.mpz(modulus)
+        mpz_values = [gmpy2.mpz(value) for value in values]
+        prefix_products = []
+        cumulative_product = gmpy2.mpz(1)
+
+        for value in mpz_values:
+            prefix_products.append(cumulative_product)
+            cumulative_product = cumulative_product * value % mpz_modulus
+
+        if cumulative_product == 0:
+            raise ValueError("base is not invertible for the given modulus")
+
+        inverse_product = gmpy2.invert(cumulative_product, mpz_modulus)
+        inverses = [0] * len(values)
+
+        for i in range(len(values) - 1, -1, -1):
+            inverses[i] = int(inverse_product * prefix_products[i] % modulus)
+            inverse_product = inverse_product * mpz_values[i] % mpz_modulus
+
+        return inverses
+
+
+    @staticmethod
+    def dot(a: Sequence[int], b: Sequence[int], modulus: int) -> int:
+        """
+        Returns the sum of the products of the given pairs of values over the
+        finite field of the given modulus.
+        """
+        cumulative_sum = sum(map(gmpy2.mul, a, b), gmpy2.mpz(0))
+
+        return int(cumulative_sum % modulus)
+
+
+BACKENDS = {PythonBackend.name: PythonBackend}
+
+if gmpy2 is not None:
+    BACKENDS[Gmpy2Backend.name] = Gmpy2Backend
+
+# The backend in use. "auto" prefers gmpy2 when it is installed. The default
+# can be chosen with the BITCOINSHAMIR_FIELD environment variable.
+backend = PythonBackend
+
+
+def get_backend() -> type:
+    """
+    Returns the field arithmetic backend currently in use.
+    """
+    return backend
+
+
+def set_backend(name: str) -> None:
+    """
+    Sets the field arithmetic backend by name: "python", "gmpy2", or "auto".
+    Raises an error if the backend is not available.
+    """
+    global backend
+
+    if not isinstance(name, str):
+        raise TypeError("The given name argument was not of the str type.")
+
+    if name == "auto":
+        name = Gmpy2Backend.name if gmpy2 is not None else PythonBackend.name
+
+    if name not in BACKENDS:
+        raise ValueError(f"The field backend '{name}' is not available.")
+
+    backend = BACKENDS[name]
+
+
+def benchmark_backends(
+        modulus: int, iterations: int = 1000
+        ) -> Dict[str, Dict[str, float]]:
+    """
+    Times each operation of every available backend over the given modulus,
+    and returns the seconds per call, by backend name and operation name.
+    """
+    byte_count = (modulus.bit_length() + 7) // 8
+    values = [
+        int.from_bytes(os.urandom(byte_count), "big") % (modulus - 1) + 1
+        for _ in range(17)
+    ]
+
+    results = {}
+
+    for name, field in BACKENDS.items():
+        operations = {
+            "mul": lambda: field.mul(values[0], values[1], modulus),
+            "inverse": lambda: field.inverse(values[0], modulus),
+            "batch_inverse": lambda: field.batch_inverse(values, modulus),
+            "dot": lambda: field.dot(values, values, modulus),
+        }
+
+        results[name] = {
+            operation: timeit.timeit(call, number=iterations) / iterations
+            for operation, call in operations.items()
+        }
+
+    return results
+
+
+set_backend(os.environ.get("BITCOINSHAMIR_FIELD", "auto"))
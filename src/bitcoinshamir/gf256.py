@@ -0,0 +1,127 @@
+from functools import lru_cache
+from typing import List, Tuple
+
+
+# Exponent and logarithm tables over GF(2^8), using the AES reduction
+# polynomial x^8 + x^4 + x^3 + x + 1 and the generator 3. The exponent table
+# is doubled in length, so that the sum of two logarithms never needs to be
+# reduced.
+EXP_TABLE = [0] * 510
+LOG_TABLE = [0] * 256
+
+_value = 1
+
+for _power in range(255):
+    EXP_TABLE[_power] = _value
+    EXP_TABLE[_power + 255] = _value
+    LOG_TABLE[_value] = _power
+
+    # Multiply by the generator, x + 1, reducing by the polynomial.
+    _doubled = _value << 1
+
+    if _doubled & 0x100:
+        _doubled ^= 0x11B
+
+    _value = _doubled ^ _value
+
+del _value, _power, _doubled
+
+# Translation tables for multiplying every byte of a bytes object by the same
+# value. They are built on first use.
+_mul_tables = []
+
+
+class GF256:
+    """
+    Class containing static methods for arithmetic and Lagrange interpolation
+    over GF(2^8), the field of single bytes. Addition and subtraction are both
+    xor. Rows of bytes are processed in bulk with bytes.translate(), so every
+    byte of many secrets is interpolated in a single pass.
+    """
+    @staticmethod
+    def mul(a: int, b: int) -> int:
+        """
+        Returns the product of the given bytes values.
+        """
+        if a == 0 or b == 0:
+            return 0
+
+        return EXP_TABLE[LOG_TABLE[a] + LOG_TABLE[b]]
+
+
+    @staticmethod
+    def inverse(value: int) -> int:
+        """
+        Returns the multiplicitive inverse of the given byte value. Raises an
+        error if the value is 0.
+        """
+        if value == 0:
+            raise ZeroDivisionError("0 has no inverse in GF(2^8).")
+
+        return EXP_TABLE[255 - LOG_TABLE[value]]
+
+
+    @staticmethod
+    def scale(row: bytes, value: int) -> bytes:
+        """
+        Returns every byte of the given row multiplied by the given byte value.
+        """
+        if not _mul_tables:
+            _mul_tables.extend(
+                bytes(GF256.mul(a, b) for b in range(256)) for a in range(256)
+            )
+
+        return row.translate(_mul_tables[value])
+
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def basis(x_values: Tuple[int, ...], X: int) -> Tuple[int, ...]:
+        """
+        Gets the Lagrange basis coefficients of the given X-values at the given
+        X. Results are cached for each layout of X-values.
+        """
+        coefficients = []
+
+        for index_a, x_a in enumerate(x_values):
+            numerator = 1
+            denominator = 1
+
+            for index_b, x_b in enumerate(x_values):
+                if index_b == index_a:
+                    continue
+
+                numerator = GF256.mul(numerator, X ^ x_b)
+                denominator = GF256.mul(denominator, x_a ^ x_b)
+
+            mul_inv = GF256.inverse(denominator)
+            coefficients.append(GF256.mul(numerator, mul_inv))
+
+        return tuple(coefficients)
+
+
+    @staticmethod
+    def interpolate(
+            x_values: Tuple[int, ...], rows: List[bytes], X: int
+            ) -> bytes:
+        """
+        Returns the row of bytes at the given X, where each given row holds the
+        Y-values at the X-value of the same index. Every byte position of the
+        rows is interpolated independently.
+        """
+        if len(x_values) != len(rows):
+            raise ValueError("The X-values and rows are not the same length.")
+
+        for x_val in x_values + (X,):
+            if x_val < 0 or x_val > 255:
+                raise ValueError(f"The X-value {x_val} is out of bounds.")
+
+        basis = GF256.basis(x_values, X)
+        row_length = len(rows[0])
+        cumulative_sum = 0
+
+        for row, coefficient in zip(rows, basis):
+            scaled_row = GF256.scale(row, coefficient)
+            cumulative_sum ^= int.from_bytes(scaled_row, "big")
+
+        return cumulative_sum.to_bytes(row_length, "big")
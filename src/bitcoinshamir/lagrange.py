@@ -1,5 +1,19 @@
+from . import field
 from .point import Point
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
+
+
+# The largest X-value of a share, which is that of version 2 shares.
+# Differences of X-values in [0, MAX_X_VALUE] are looked up in a table of
+# inverses instead of being inverted.
+MAX_X_VALUE = 2049
+
+# Tables of inverses, and inverse factorials, of 1 to MAX_X_VALUE, by modulus,
+# built on first use.
+_small_inverse_tables = {}
+_inverse_factorial_tables = {}
+
 
 class Lagrange:
     """
@@ -30,23 +44,215 @@ class Lagrange:
             elif point.X < 0 or point.Y < 0:
                 raise ValueError(f"({point.X}, {point.Y}) has negative value.")
 
-        # This will be the return value.
-        cumulative_sum = 0
+        # The basis only depends on the X-values, so it is cached for each
+        # layout of points.
+        x_values = tuple(point.X for point in points)
+        basis = Lagrange.basis(x_values, modulus, X)
+
+        return field.get_backend().dot(
+            [point.Y for point in points], basis, modulus
+        )
+
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def basis(
+            x_values: Tuple[int, ...], modulus: int, X: int
+            ) -> Tuple[int, ...]:
+        """
+        Gets the Lagrange basis coefficients of the given X-values at the given
+        X, over the finite field of the given modulus. The interpolated Y-value
+        is the sum of each point's Y-value times its coefficient. Results are
+        cached, since the same X-values are used again for every secret split
+        or recovered with the same layout of shares.
+        """
+        backend = field.get_backend()
+
+        # Share X-values are between 2 and MAX_X_VALUE, and the only other
+        # X-values used are 0 and 1, so the inverse of every denominator can be
+        # built from the table of inverses of small differences.
+        bounded_values = x_values + (X,)
+
+        if min(bounded_values) >= 0 and max(bounded_values) <= MAX_X_VALUE:
+            if modulus > MAX_X_VALUE:
+                # Consecutive X-values, such as the base points of a split,
+                # need only O(k) multiplications instead of O(k^2).
+                first_x = x_values[0]
+                last_x = first_x + len(x_values) - 1
+
+                if x_values == tuple(range(first_x, last_x + 1)):
+                    return Lagrange._consecutive_basis(x_values, modulus, X)
+
+                return Lagrange._small_domain_basis(x_values, modulus, X)
+
+        numerators = []
+        denominators = []
 
         # Sum loop.
-        for point_a in points:
-            cumulative_product = point_a.Y
+        for index_a, x_a in enumerate(x_values):
+            numerator = 1
+            denominator = 1
 
             # Product loop.
-            for point_b in [p for p in points if p is not point_a]:
-                numerator = (X - point_b.X) % modulus
-                denominator = (point_a.X - point_b.X) % modulus
+            for index_b, x_b in enumerate(x_values):
+                if index_b == index_a:
+                    continue
+
+                numerator = numerator * (X - x_b) % modulus
+                denominator = denominator * (x_a - x_b) % modulus
+
+            numerators.append(numerator)
+            denominators.append(denominator)
+
+        # All denominators are inverted together with a single inversion.
+        inverses = backend.batch_inverse(denominators, modulus)
+
+        return tuple(
+            backend.mul(numerator, mul_inv, modulus)
+            for numerator, mul_inv in zip(numerators, inverses)
+        )
+
+
+    @staticmethod
+    def small_inverses(modulus: int) -> List[int]:
+        """
+        Returns the table of multiplicitive inverses of 0 to MAX_X_VALUE over
+        the finite field of the given modulus, where 0 maps to 0. The table is
+        built with a single inversion on first use for each modulus.
+        """
+        inverses = _small_inverse_tables.get(modulus)
+
+        if inverses is None:
+            values = range(1, MAX_X_VALUE + 1)
+            inverses = [0] + field.get_backend().batch_inverse(values, modulus)
+            _small_inverse_tables[modulus] = inverses
+
+        return inverses
+
+
+    @staticmethod
+    def inverse_factorials(modulus: int) -> List[int]:
+        """
+        Returns the table of multiplicitive inverses of 0! to MAX_X_VALUE! over
+        the finite field of the given modulus. The table is built from the
+        table of small inverses on first use for each modulus.
+        """
+        inverse_factorials = _inverse_factorial_tables.get(modulus)
+
+        if inverse_factorials is None:
+            inverses = Lagrange.small_inverses(modulus)
+            inverse_factorials = [1]
+
+            for value in range(1, MAX_X_VALUE + 1):
+                inverse_factorial = inverse_factorials[-1] * inverses[value]
+                inverse_factorials.append(inverse_factorial % modulus)
+
+            _inverse_factorial_tables[modulus] = inverse_factorials
+
+        return inverse_factorials
+
+
+    @staticmethod
+    def _consecutive_basis(
+            x_values: Tuple[int, ...], modulus: int, X: int
+            ) -> Tuple[int, ...]:
+        """
+        Gets the Lagrange basis coefficients of the given consecutive X-values
+        at the given X, using O(k) multiplications. Every value must be
+        between 0 and MAX_X_VALUE.
+        """
+        first_x = x_values[0]
+        count = len(x_values)
+
+        # At one of the X-values, its coefficient is 1 and the rest are 0.
+        if first_x <= X < first_x + count:
+            coefficients = [0] * count
+            coefficients[X - first_x] = 1
+
+            return tuple(coefficients)
+
+        # Barycentric form: each coefficient is the product of (X - x) for
+        # every X-value, times the X-value's weight, divided by (X - x) for
+        # its own X-value.
+        inverses = Lagrange.small_inverses(modulus)
+        weights = Lagrange._consecutive_weights(count, modulus)
+        node_product = 1
+
+        for x_val in x_values:
+            node_product = node_product * (X - x_val) % modulus
+
+        coefficients = []
+
+        for x_val, weight in zip(x_values, weights):
+            difference = X - x_val
+
+            if difference > 0:
+                mul_inv = inverses[difference]
+            else:
+                mul_inv = modulus - inverses[-difference]
+
+            coefficient = node_product * weight % modulus
+            coefficients.append(coefficient * mul_inv % modulus)
+
+        return tuple(coefficients)
+
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _consecutive_weights(count: int, modulus: int) -> Tuple[int, ...]:
+        """
+        Gets the barycentric weights of the given number of consecutive
+        X-values, which are the same wherever the X-values start.
+        """
+        # The weight of the jth X-value is the inverse of j! * (k - 1 - j)!,
+        # negated if k - 1 - j is odd.
+        inverse_factorials = Lagrange.inverse_factorials(modulus)
+        weights = []
+
+        for j in range(count):
+            weight = inverse_factorials[j] * inverse_factorials[count - 1 - j]
+            weight %= modulus
+
+            if (count - 1 - j) % 2 == 1:
+                weight = (modulus - weight) % modulus
+
+            weights.append(weight)
+
+        return tuple(weights)
+
+
+    @staticmethod
+    def _small_domain_basis(
+            x_values: Tuple[int, ...], modulus: int, X: int
+            ) -> Tuple[int, ...]:
+        """
+        Gets the Lagrange basis coefficients of the given X-values at the given
+        X, where every value is between 0 and MAX_X_VALUE, using only
+        multiplications and the table of small inverses.
+        """
+        inverses = Lagrange.small_inverses(modulus)
+        coefficients = []
+
+        for index_a, x_a in enumerate(x_values):
+            coefficient = 1
+
+            for index_b, x_b in enumerate(x_values):
+                if index_b == index_a:
+                    continue
+
+                difference = x_a - x_b
+
+                if difference == 0:
+                    message = f"The X-value {x_a} is given more than once."
+                    raise ValueError(message)
+                elif difference > 0:
+                    mul_inv = inverses[difference]
+                else:
+                    mul_inv = modulus - inverses[-difference]
 
-                # Multiplicitive inverse using Fermat's little theorem.
-                mul_inv = pow(denominator, modulus - 2, modulus)
-                product = numerator * mul_inv % modulus
-                cumulative_product = cumulative_product * product % modulus
+                coefficient = coefficient * (X - x_b) % modulus
+                coefficient = coefficient * mul_inv % modulus
 
-            cumulative_sum = (cumulative_sum + cumulative_product) % modulus
+            coefficients.append(coefficient)
 
-        return cumulative_sum
\ No newline at end of file
+        return tuple(coefficients)
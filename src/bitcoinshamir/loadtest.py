@@ -0,0 +1,206 @@
+import random
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Sequence
+from .bitcoinshamir import create_shares, get_phrase, recover_mnemonic
+from .enums import Language
+from .exceptions import LoadTestError
+from .mnemonic import Mnemonic
+from .share import Share
+from .stats import percentile
+
+
+STAGES = ("split", "render", "parse", "recover")
+
+# Mnemonics are generated in blocks of this size, and latencies are kept as a
+# uniform random sample of at most this many per stage, so memory use does not
+# grow with the size of the vault population.
+GENERATION_BLOCK_SIZE = 1000
+LATENCY_SAMPLE_SIZE = 65536
+
+
+def run_load_test(
+        vault_count: int, thresholds: Sequence[int] = range(2, 18),
+        extra_shares: int = 2, language: Language = Language.English,
+        trace_memory: bool = False) -> Dict[str, object]:
+    """
+    Runs the full split, phrase render, phrase parse, and recover cycle for
+    the given number of synthetic vaults, and returns the throughput, and the
+    latency percentiles of each stage in milliseconds. The vaults cycle
+    through the given thresholds, each with the given number of shares beyond
+    its threshold, and each recovered mnemonic is verified against its vault.
+
+    If trace_memory is set, the vaults are run a second time under
+    tracemalloc, which slows every stage down, and the peak traced memory in
+    bytes is also returned. The latencies are only taken from the first,
+    untraced run.
+    """
+    if not isinstance(vault_count, int):
+        raise TypeError("The vault_count argument was not of the int type.")
+
+    if vault_count < 1:
+        raise ValueError("The given vault_count argument is out of bounds.")
+
+    thresholds = list(thresholds)
+    latencies = {stage: [] for stage in STAGES}
+
+    started = time.perf_counter()
+    _run_vaults(vault_count, thresholds, extra_shares, language, latencies)
+    elapsed = time.perf_counter() - started
+    peak_memory = None
+
+    if trace_memory:
+        tracemalloc.start()
+
+        try:
+            _run_vaults(vault_count, thresholds, extra_shares, language)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    stage_percentiles = {}
+
+    for stage, stage_latencies in latencies.items():
+        stage_latencies.sort()
+        stage_percentiles[stage] = {
+            "p50_ms": percentile(stage_latencies, 0.50) * 1000,
+            "p90_ms": percentile(stage_latencies, 0.90) * 1000,
+            "p99_ms": percentile(stage_latencies, 0.99) * 1000,
+        }
+
+    return {
+        "vault_count": vault_count,
+        "elapsed_seconds": elapsed,
+        "vaults_per_second": vault_count / elapsed,
+        "peak_memory_bytes": peak_memory,
+        "stages": stage_percentiles,
+    }
+
+
+def check_ceilings(
+        report: Dict[str, object], max_peak_memory: Optional[int] = None,
+        max_p99_ms: Optional[float] = None,
+        min_vaults_per_second: Optional[float] = None) -> None:
+    """
+    Raises a LoadTestError listing every ceiling that the given load test
+    report exceeds. Ceilings that are not given are not checked, and a peak
+    memory ceiling fails if the report has no traced memory.
+    """
+    failures = []
+
+    if max_peak_memory is not None:
+        if report["peak_memory_bytes"] is None:
+            failures.append("Peak memory was not traced.")
+        elif report["peak_memory_bytes"] > max_peak_memory:
+            failures.append(
+                f"Peak memory of {report['peak_memory_bytes']} bytes is over "
+                f"{max_peak_memory} bytes."
+            )
+
+    if max_p99_ms is not None:
+        for stage, percentiles in report["stages"].items():
+            if percentiles["p99_ms"] > max_p99_ms:
+                failures.append(
+                    f"The {stage} p99 of {percentiles['p99_ms']:.3f} ms is "
+                    f"over {max_p99_ms} ms."
+                )
+
+    if min_vaults_per_second is not None:
+        if report["vaults_per_second"] < min_vaults_per_second:
+            failures.append(
+                f"Throughput of {report['vaults_per_second']:.1f} vaults/s is "
+                f"under {min_vaults_per_second} vaults/s."
+            )
+
+    if failures:
+        raise LoadTestError(failures)
+
+
+def run_scaling_test(
+        vault_counts: Sequence[int] = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6),
+        **kwargs: object) -> List[Dict[str, object]]:
+    """
+    Runs a load test for each of the given vault population sizes, and
+    returns their reports. Keyword arguments are passed to run_load_test().
+    """
+    return [
+        run_load_test(vault_count, **kwargs) for vault_count in vault_counts
+    ]
+
+
+def _run_vaults(
+        vault_count: int, thresholds: List[int], extra_shares: int,
+        language: Language,
+        latencies: Optional[Dict[str, List[float]]] = None) -> None:
+    """
+    Runs each stage for the given number of vaults, adding the time of each
+    stage to a sample of the given latencies, if any.
+    """
+    for block_start in range(0, vault_count, GENERATION_BLOCK_SIZE):
+        block_size = min(GENERATION_BLOCK_SIZE, vault_count - block_start)
+        mnemonics = Mnemonic.generate_batch(block_size)
+
+        for i, mnemonic in enumerate(mnemonics):
+            threshold = thresholds[(block_start + i) % len(thresholds)]
+            sharecount = min(threshold + extra_shares, 128)
+            vault_index = block_start + i
+            vault_latencies = _run_vault(
+                threshold, sharecount, mnemonic, language
+            )
+
+            if latencies is None:
+                continue
+
+            for stage, seconds in zip(STAGES, vault_latencies):
+                _sample(latencies[stage], vault_index, seconds)
+
+
+def _run_vault(
+        threshold: int, sharecount: int, mnemonic: Mnemonic,
+        language: Language) -> List[float]:
+    """
+    Runs each stage for a single vault, and returns the time of each stage in
+    seconds. Every share is rendered, and a random subset of the threshold
+    size is parsed and recovered.
+    """
+    stage_started = time.perf_counter()
+    shares = create_shares(threshold, sharecount, mnemonic)
+    split_finished = time.perf_counter()
+
+    phrases = [get_phrase(share, language) for share in shares]
+    render_finished = time.perf_counter()
+
+    recovery_phrases = random.sample(phrases, threshold)
+    parsed_shares = [
+        Share.from_share_phrase(phrase, language)
+        for phrase in recovery_phrases
+    ]
+    parse_finished = time.perf_counter()
+
+    recovered_mnemonic = recover_mnemonic(parsed_shares)
+    recover_finished = time.perf_counter()
+
+    if recovered_mnemonic.seed != mnemonic.seed:
+        raise LoadTestError(["A recovered mnemonic did not match its vault."])
+
+    return [
+        split_finished - stage_started,
+        render_finished - split_finished,
+        parse_finished - render_finished,
+        recover_finished - parse_finished,
+    ]
+
+
+def _sample(samples: List[float], index: int, value: float) -> None:
+    """
+    Adds the value with the given zero-based index to the given samples, so
+    that the samples stay a uniform random sample of all values seen.
+    """
+    if len(samples) < LATENCY_SAMPLE_SIZE:
+        samples.append(value)
+        return
+
+    replace_index = random.randrange(index + 1)
+
+    if replace_index < LATENCY_SAMPLE_SIZE:
+        samples[replace_index] = value
@@ -1,14 +1,20 @@
 from .exceptions import ChecksumError, LanguageError, WordlistError
 from .BIP39_List import BIP39_List
-from .enums import Language
+from .enums import Checksum, Language
 from .encode import Encode
 from .decode import Decode
-from hashlib import sha256
-from typing import List
+from hashlib import pbkdf2_hmac, sha256
+from typing import Iterator, List, Union
 import os
+import unicodedata
 
 wordlist = BIP39_List()
 
+# BIP39 seeds are derived with PBKDF2-HMAC-SHA512 over the NFKD normalized
+# phrase, salted with "mnemonic" and the passphrase.
+PBKDF2_ROUNDS = 2048
+SEED_SALT_PREFIX = "mnemonic"
+
 class Mnemonic:
     """
     Mnemonic class for holding a 24-word BIP44 seed phrase. The Mnemonic holds
@@ -18,8 +24,41 @@ class Mnemonic:
         """
         Initializes a new instance of the Mnemonic class.
         """
-        self.seed = bytes(32)
-        self.checksum = bytes(1)
+        self._seed = bytes(32)
+        self._checksum = bytes(1)
+
+        # The 264-bit integer form of the mnemonic, built on first use and
+        # cleared whenever the seed or checksum is replaced.
+        self._mnemonic_int = None
+
+
+    @property
+    def seed(self) -> bytes:
+        """
+        The first 32 bytes of the mnemonic, which are the secret key.
+        """
+        return self._seed
+
+
+    @seed.setter
+    def seed(self, value: bytes) -> None:
+        self._seed = value
+        self._mnemonic_int = None
+
+
+    @property
+    def checksum(self) -> bytes:
+        """
+        The last byte of the mnemonic, which is the first byte of the sha256
+        hash of the seed.
+        """
+        return self._checksum
+
+
+    @checksum.setter
+    def checksum(self, value: bytes) -> None:
+        self._checksum = value
+        self._mnemonic_int = None
 
 
     @classmethod
@@ -35,6 +74,37 @@ class Mnemonic:
         return mnemonic
 
 
+    @staticmethod
+    def generate_batch(count: int) -> "MnemonicBatch":
+        """
+        Generates and returns the given number of random mnemonics as a single
+        MnemonicBatch. Entropy is read from os.urandom() in large blocks rather
+        than once per mnemonic.
+        """
+        if not isinstance(count, int):
+            raise TypeError("The count argument was not of the int type.")
+
+        if count < 0:
+            raise ValueError("The given count argument is out of bounds.")
+
+        # Read at most 1 MiB of entropy per call.
+        block_size = 32 * 32768
+        total_size = 32 * count
+        seed_blocks = []
+
+        for offset in range(0, total_size, block_size):
+            seed_blocks.append(os.urandom(min(block_size, total_size - offset)))
+
+        seeds = b"".join(seed_blocks)
+        seed_view = memoryview(seeds)
+        checksums = bytes(
+            sha256(seed_view[offset:offset + 32]).digest()[0]
+            for offset in range(0, total_size, 32)
+        )
+
+        return MnemonicBatch(seeds, checksums)
+
+
     @classmethod
     def from_bytes(cls, key: bytes) -> "Mnemonic":
         """
@@ -49,16 +119,18 @@ class Mnemonic:
             message = "32 bytes for key argument required. {0} received."
             raise ValueError(message.format(len(key)))
         elif len(key) == 32:
-            checksum = sha256(key[:32])[:1]
+            checksum = sha256(key[:32]).digest()[:1]
             key += checksum
         elif len(key) == 33:
             given_checksum = key[-1:]
-            recalculated_checksum = sha256(key[:32])[:1]
+            recalculated_checksum = sha256(key[:32]).digest()[:1]
 
             is_valid_checksum = given_checksum == recalculated_checksum
 
             if not is_valid_checksum:
-                raise ChecksumError(given_checksum, recalculated_checksum)
+                raise ChecksumError(
+                    Checksum.Mnemonic, given_checksum, recalculated_checksum
+                )
         else:
             message = "The key argument should be 32-33 bytes. {0} received."
             raise ValueError(message.format(len(key)))
@@ -70,6 +142,42 @@ class Mnemonic:
         return mnemonic
 
 
+    @classmethod
+    def from_phrase(cls, phrase: List[str], language: Language) -> "Mnemonic":
+        """
+        Returns a Mnemonic class instance based on the given 24-word mnemonic
+        phrase. The phrase is parsed, hashed, and validated once. Raises an
+        error if a word is not in the given language's word list, or the
+        checksum is not valid.
+        """
+        if not isinstance(language, Language):
+            raise ValueError(f"{language} is not in the language list.")
+
+        if not isinstance(phrase, list):
+            raise TypeError("The given phrase was not of the list[str] type.")
+
+        if len(phrase) != 24:
+            raise ValueError("Phrase does not have 24 words")
+
+        mnemonic_int = _phrase_int(phrase, language)
+        mnemonic_bytes = mnemonic_int.to_bytes(33, "big")
+        seed = mnemonic_bytes[:-1]
+        checksum = mnemonic_bytes[-1:]
+        recalculated_checksum = sha256(seed).digest()[:1]
+
+        if checksum != recalculated_checksum:
+            raise ChecksumError(
+                Checksum.Mnemonic, checksum, recalculated_checksum
+            )
+
+        mnemonic = cls()
+        mnemonic.seed = seed
+        mnemonic.checksum = checksum
+        mnemonic._mnemonic_int = mnemonic_int
+
+        return mnemonic
+
+
     @staticmethod
     def validate_phrase(phrase: List[str], language: Language) -> bool:
         """
@@ -83,22 +191,12 @@ class Mnemonic:
         if len(phrase) != 24:
             raise ValueError("Phrase does not have 24 words")
 
-        for word in phrase:
-            if language not in wordlist.get_language(word):
-                raise WordlistError(word, language)
-
-        # Add words from left to right, shifting the added words to the left by
-        # 11 bits each iteration.
-        indices = [wordlist.get_word_index(word, language) for word in phrase]
-        mnemonic_int = 0
-
-        for word_index in indices:
-            mnemonic_int <<= 11
-            mnemonic_int += word_index
+        mnemonic_int = _phrase_int(phrase, language)
 
         # Validate checksum.
-        given_phrase_seed = Encode.mnemonic_seed(mnemonic_int)
-        given_phrase_checksum = Encode.mnemonic_checksum(mnemonic_int)
+        mnemonic_bytes = mnemonic_int.to_bytes(33, "big")
+        given_phrase_seed = mnemonic_bytes[:-1]
+        given_phrase_checksum = mnemonic_bytes[-1:]
         recalculated_checksum = sha256(given_phrase_seed).digest()[:1]
         
         is_valid_checksum = given_phrase_checksum == recalculated_checksum
@@ -132,7 +230,7 @@ class Mnemonic:
         word_delete_bitmask ^= 0b1111_1111_111 << (word_count_right_side * 11)
 
         # Delete the current bits at the given word index.
-        mnemonic_int = Decode.mnemonic_int(self.seed, self.checksum)
+        mnemonic_int = self._get_mnemonic_int()
         mnemonic_int &= word_delete_bitmask
 
         # Set the word bits at the given word index.
@@ -152,10 +250,17 @@ class Mnemonic:
             mnemonic_int >>= 8
             mnemonic_int <<= 8
             mnemonic_int += checksum_int
-            
+
+            # The checksum was just calculated, so it is not verified again.
+            mnemonic_bytes = seed_bin + checksum_bin
+        else:
+            # The last word sets the checksum, which must be verified.
+            mnemonic_bytes = Encode.mnemonic_bytes(mnemonic_int)
+
         # Update class instance variables
-        self.seed = Encode.mnemonic_seed(mnemonic_int)
-        self.checksum = Encode.mnemonic_checksum(mnemonic_int)
+        self.seed = mnemonic_bytes[:-1]
+        self.checksum = mnemonic_bytes[-1:]
+        self._mnemonic_int = mnemonic_int
 
 
     def get_word(self, index: int, language: Language) -> str:
@@ -178,7 +283,7 @@ class Mnemonic:
         word_position = index + 1
         word_count_right_side = max_words - word_position
 
-        mnemonic_int = Decode.mnemonic_int(self.seed, self.checksum)
+        mnemonic_int = self._get_mnemonic_int()
         truncated_mnemonic_int = mnemonic_int >> (word_count_right_side * 11)
 
         # Get word index and return word text.
@@ -187,3 +292,178 @@ class Mnemonic:
         word = wordlist.get_word(word_index, language)
 
         return word
+
+
+    def get_word_indices(self) -> List[int]:
+        """
+        Returns the 24 word list indices of this Mnemonic class instance, which
+        are the same for every language.
+        """
+        mnemonic_int = self._get_mnemonic_int()
+        word_bitmask = 0b1111_1111_111
+
+        # The first word is the left-most 11 bits of the 264-bit integer.
+        return [
+            (mnemonic_int >> (word_count_right_side * 11)) & word_bitmask
+            for word_count_right_side in range(23, -1, -1)
+        ]
+
+
+    def get_phrase_string(self, language: Language) -> str:
+        """
+        Returns the phrase of this Mnemonic class instance in the given
+        language as a single NFKD normalized string, with the words separated
+        by spaces. The words are looked up from the cached word indices.
+        """
+        if not isinstance(language, Language):
+            raise ValueError(f"{language} is not in the language list.")
+
+        words = wordlist.get_word_list(language)
+        phrase = " ".join([words[index] for index in self.get_word_indices()])
+
+        return unicodedata.normalize("NFKD", phrase)
+
+
+    def to_seed(
+            self, passphrase: str = "", language: Language = Language.English
+            ) -> bytes:
+        """
+        Returns the 64-byte BIP39 seed of this Mnemonic class instance, derived
+        from its phrase in the given language and the given passphrase. Raises
+        an error if the passphrase is not a str.
+        """
+        if not isinstance(passphrase, str):
+            raise TypeError("The passphrase argument was not of the str type.")
+
+        phrase_bin = self.get_phrase_string(language).encode("utf-8")
+        salt = unicodedata.normalize("NFKD", SEED_SALT_PREFIX + passphrase)
+
+        return pbkdf2_hmac(
+            "sha512", phrase_bin, salt.encode("utf-8"), PBKDF2_ROUNDS
+        )
+
+
+    def _get_mnemonic_int(self) -> int:
+        """
+        Returns the 264-bit integer form of this Mnemonic class instance, which
+        is cached until the seed or checksum is replaced.
+        """
+        if self._mnemonic_int is None:
+            self._mnemonic_int = Decode.mnemonic_int(self.seed, self.checksum)
+
+        return self._mnemonic_int
+
+
+class MnemonicBatch:
+    """
+    MnemonicBatch class for holding many mnemonics in compact form. The seeds
+    are joined into a single bytes object of 32 bytes per mnemonic, and the
+    checksums into another of 1 byte per mnemonic. Mnemonic objects are only
+    created when an item is accessed.
+    """
+    def __init__(self, seeds: bytes, checksums: bytes) -> None:
+        """
+        Initializes a new instance of the MnemonicBatch class with the given
+        joined seeds and checksums.
+        """
+        if not isinstance(seeds, bytes) or not isinstance(checksums, bytes):
+            raise TypeError("The given seeds and checksums were not bytes.")
+
+        if len(seeds) != 32 * len(checksums):
+            message = "The given seeds do not match the number of checksums."
+            raise ValueError(message)
+
+        self.seeds = seeds
+        self.checksums = checksums
+
+
+    @classmethod
+    def from_mnemonics(cls, mnemonics: List[Mnemonic]) -> "MnemonicBatch":
+        """
+        Returns a MnemonicBatch class instance holding the given Mnemonic
+        objects.
+        """
+        seeds = b"".join(mnemonic.seed for mnemonic in mnemonics)
+        checksums = b"".join(mnemonic.checksum for mnemonic in mnemonics)
+
+        return cls(seeds, checksums)
+
+
+    def __len__(self) -> int:
+        """
+        Returns the number of mnemonics in this MnemonicBatch class instance.
+        """
+        return len(self.checksums)
+
+
+    def __getitem__(
+            self, index: int | slice
+            ) -> Union[Mnemonic, "MnemonicBatch"]:
+        """
+        Returns a Mnemonic object for the mnemonic at the given index, or a new
+        MnemonicBatch class instance holding the mnemonics of the given slice.
+        """
+        if isinstance(index, slice):
+            indices = range(len(self))[index]
+
+            # A contiguous slice is a single byte range of each joined value.
+            if indices.step == 1:
+                start = indices.start
+                stop = max(indices.stop, start)
+
+                return MnemonicBatch(
+                    self.seeds[start * 32:stop * 32],
+                    self.checksums[start:stop]
+                )
+
+            return MnemonicBatch(
+                b"".join(self.seeds[i * 32:(i + 1) * 32] for i in indices),
+                bytes(self.checksums[i] for i in indices)
+            )
+
+        if not isinstance(index, int):
+            raise TypeError("The index argument given is not an int or slice.")
+
+        if index < 0:
+            index += len(self)
+
+        if index < 0 or index >= len(self):
+            raise IndexError("The index argument given is out of bounds.")
+
+        mnemonic = Mnemonic()
+        mnemonic.seed = self.seeds[index * 32:(index + 1) * 32]
+        mnemonic.checksum = self.checksums[index:index + 1]
+
+        return mnemonic
+
+
+    def __iter__(self) -> Iterator[Mnemonic]:
+        """
+        Yields a Mnemonic object for each mnemonic in this MnemonicBatch class
+        instance.
+        """
+        for index in range(len(self)):
+            yield self[index]
+
+
+def _phrase_int(phrase: List[str], language: Language) -> int:
+    """
+    Returns the integer represented by the given phrase, with each word adding
+    11 bits. Raises an error if a word is not in the given language's word
+    list.
+    """
+    index_table = wordlist.get_index_table(language)
+    phrase_int = 0
+
+    # Add words from left to right, shifting the added words to the left by
+    # 11 bits each iteration.
+    for word in phrase:
+        word_index = index_table.get(word)
+
+        if word_index is None:
+            raise WordlistError(word, language)
+
+        phrase_int <<= 11
+        phrase_int += word_index
+
+    return phrase_int
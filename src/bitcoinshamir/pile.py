@@ -0,0 +1,154 @@
+from typing import Dict, Iterable, List, Tuple
+from .enums import ShareStatus
+from .share import Share
+
+
+# Share groups are keyed by (seed checksum, version, threshold), and shares by
+# (seed checksum, version, threshold, X-value).
+GroupKey = Tuple[bytes, int, int]
+ShareKey = Tuple[bytes, int, int, int]
+
+
+class ShareIndex:
+    """
+    ShareIndex class for sorting a large pile of shares into share groups.
+    Each share is keyed by its seed checksum, version, threshold, and X-value,
+    so adding a share takes constant time. A share identical to one already
+    indexed is a duplicate, and a share with the same key but a different
+    Y-value is a conflict. Conflicting shares are kept aside, rather than
+    replacing the share indexed first, and a conflicting share added again is
+    a duplicate.
+
+    Share groups are identified by their seed checksum, version, and
+    threshold. The seed checksum is a single byte, so unrelated mnemonics can
+    share a group by chance. recover_mnemonic() still detects such mixes with
+    its key hash check.
+    """
+    def __init__(self) -> None:
+        """
+        Initializes a new, empty instance of the ShareIndex class.
+        """
+        self._groups = {}
+        self._conflicts = {}
+        self.duplicate_count = 0
+
+
+    def add(self, share: Share) -> ShareStatus:
+        """
+        Adds the given share to the index, and returns whether it was added,
+        was a duplicate, or was a conflict.
+        """
+        if not isinstance(share, Share):
+            raise TypeError("The given share argument is not of type Share.")
+
+        group_key = (share.seed_checksum, share.version, share.threshold)
+        group = self._groups.setdefault(group_key, {})
+        indexed_share = group.get(share.point.X)
+
+        if indexed_share is None:
+            group[share.point.X] = share
+            return ShareStatus.Added
+
+        if indexed_share.point.Y == share.point.Y:
+            self.duplicate_count += 1
+            return ShareStatus.Duplicate
+
+        # A conflicting share that was already added is a duplicate of it.
+        share_key = group_key + (share.point.X,)
+        conflicts = self._conflicts.setdefault(share_key, [])
+
+        for conflict in conflicts:
+            if conflict.point.Y == share.point.Y:
+                self.duplicate_count += 1
+                return ShareStatus.Duplicate
+
+        conflicts.append(share)
+
+        return ShareStatus.Conflict
+
+
+    def add_all(self, shares: Iterable[Share]) -> Dict[ShareStatus, int]:
+        """
+        Adds each of the given shares to the index, and returns the number of
+        shares of each status.
+        """
+        counts = {status: 0 for status in ShareStatus}
+
+        for share in shares:
+            counts[self.add(share)] += 1
+
+        return counts
+
+
+    def get_groups(self) -> List[GroupKey]:
+        """
+        Returns the (seed checksum, version, threshold) key of each share group
+        in the index.
+        """
+        return list(self._groups)
+
+
+    def get_shares(self, group_key: GroupKey) -> List[Share]:
+        """
+        Returns the unique shares of the given share group, sorted by X-value.
+        """
+        group = self._groups.get(group_key, {})
+
+        return [group[x_val] for x_val in sorted(group)]
+
+
+    def get_needed(self, group_key: GroupKey) -> int:
+        """
+        Returns how many more unique shares the given share group needs to
+        meet its threshold.
+        """
+        _, _, threshold = group_key
+
+        return max(0, threshold - len(self._groups.get(group_key, {})))
+
+
+    def get_progress(self) -> Dict[GroupKey, int]:
+        """
+        Returns a dictionary of each share group, mapped to how many more
+        unique shares it needs to meet its threshold.
+        """
+        return {
+            group_key: self.get_needed(group_key)
+            for group_key in self._groups
+        }
+
+
+    def get_ready_groups(self) -> List[GroupKey]:
+        """
+        Returns each share group that meets its threshold, and has no
+        conflicting shares.
+        """
+        conflicted_groups = {share_key[:3] for share_key in self._conflicts}
+
+        return [
+            group_key for group_key in self._groups
+            if self.get_needed(group_key) == 0
+            and group_key not in conflicted_groups
+        ]
+
+
+    def get_conflicts(self) -> Dict[ShareKey, List[Share]]:
+        """
+        Returns a dictionary of each (seed checksum, version, threshold,
+        X-value) key with conflicts, mapped to the indexed share followed by
+        each conflicting share.
+        """
+        conflicts = {}
+
+        for share_key, shares in self._conflicts.items():
+            indexed_share = self._groups[share_key[:3]][share_key[3]]
+            conflicts[share_key] = [indexed_share] + shares
+
+        return conflicts
+
+
+    def __len__(self) -> int:
+        """
+        Returns the number of unique shares in the index.
+        """
+        return sum(len(group) for group in self._groups.values())
@@ -1,3 +1,6 @@
+from . import field
+
+
 class Polynomial:
     """
     Polynomial class for storing coefficients of a polynomial in a finite
@@ -33,9 +36,11 @@ class Polynomial:
         Returns the Y value of the current polynomial coefficients based on the
         given X value.
         """
+        backend = field.get_backend()
         result = 0
 
-        for i, coefficient in enumerate(self.coefficients):
-            result += coefficient * x ** i % modulus
-        
-        return result % modulus
\ No newline at end of file
+        # Horner's method, starting from the highest order coefficient.
+        for coefficient in reversed(self.coefficients):
+            result = (backend.mul(result, x, modulus) + coefficient) % modulus
+
+        return result
\ No newline at end of file
@@ -0,0 +1,437 @@
+import ipaddress
+import json
+import os
+import queue
+import socketserver
+import stat
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+from .bitcoinshamir import (
+    create_shares_batch, get_phrase, recover_mnemonic, recover_mnemonic_batch,
+    translate_phrase
+)
+from .enums import Language
+from .mnemonic import Mnemonic
+from .share import Share, current_version
+from .stats import percentile
+
+
+# Request bodies larger than this are refused before they are read. The
+# largest recovery, of 2048 share phrases in any language, is well under it.
+MAX_REQUEST_SIZE = 4 * 1024 * 1024
+
+
+class MicroBatcher:
+    """
+    Groups items submitted by concurrent threads into batches by key. A worker
+    thread waits up to the batch window after the first item of a batch, then
+    passes each group of items with the same key to the handler, which returns
+    one result, or exception, per item.
+    """
+    def __init__(
+            self, handler: Callable[[Hashable, List[object]], List[object]],
+            window: float = 0.002, max_batch: int = 256) -> None:
+        """
+        Initializes a new instance of the MicroBatcher class, and starts its
+        worker thread.
+        """
+        self.handler = handler
+        self.window = window
+        self.max_batch = max_batch
+        self.batch_sizes = deque(maxlen=1024)
+        self._queue = queue.Queue()
+
+        worker = threading.Thread(target=self._run, daemon=True)
+        worker.start()
+
+
+    def submit(self, key: Hashable, item: object) -> object:
+        """
+        Adds the given item to the next batch for the given key, and blocks
+        until its result is ready. Raises the item's exception, if any.
+        """
+        future = Future()
+        self._queue.put((key, item, future))
+
+        return future.result()
+
+
+    def _run(self) -> None:
+        """
+        Collects and handles batches until the process exits.
+        """
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.window
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+
+                if timeout <= 0:
+                    break
+
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            groups = {}
+
+            for key, item, future in batch:
+                groups.setdefault(key, []).append((item, future))
+
+            for key, entries in groups.items():
+                self.batch_sizes.append(len(entries))
+                items = [item for item, _ in entries]
+
+                try:
+                    results = self.handler(key, items)
+                except Exception as error:
+                    results = [error] * len(items)
+
+                for (_, future), result in zip(entries, results):
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+
+
+class ServerStats:
+    """
+    Thread-safe request counts and latencies of the daemon, by endpoint.
+    """
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the ServerStats class.
+        """
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+        self._counts = {}
+        self._errors = {}
+        self._latencies = {}
+
+
+    def record(self, endpoint: str, seconds: float, is_error: bool) -> None:
+        """
+        Records a handled request of the given endpoint.
+        """
+        with self._lock:
+            self._counts[endpoint] = self._counts.get(endpoint, 0) + 1
+
+            if is_error:
+                self._errors[endpoint] = self._errors.get(endpoint, 0) + 1
+
+            if endpoint not in self._latencies:
+                self._latencies[endpoint] = deque(maxlen=4096)
+
+            self._latencies[endpoint].append(seconds)
+
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Returns the current stats, with latency percentiles in milliseconds of
+        the most recent requests of each endpoint.
+        """
+        with self._lock:
+            uptime = time.monotonic() - self.started
+            endpoints = {}
+
+            for endpoint, count in self._counts.items():
+                latencies = sorted(self._latencies[endpoint])
+                endpoints[endpoint] = {
+                    "requests": count,
+                    "errors": self._errors.get(endpoint, 0),
+                    "requests_per_second": count / uptime,
+                    "p50_ms": percentile(latencies, 0.50) * 1000,
+                    "p90_ms": percentile(latencies, 0.90) * 1000,
+                    "p99_ms": percentile(latencies, 0.99) * 1000,
+                }
+
+        return {"uptime_seconds": uptime, "endpoints": endpoints}
+
+
+class ShamirService:
+    """
+    The split, recover, and phrase operations of the daemon. Splits with the
+    same scheme, and recoveries with the same X-values, that arrive together
+    are handled as one batch.
+    """
+    def __init__(self, window: float = 0.002, max_batch: int = 256) -> None:
+        """
+        Initializes a new instance of the ShamirService class.
+        """
+        self.stats = ServerStats()
+        self.split_batcher = MicroBatcher(_split_batch, window, max_batch)
+        self.recover_batcher = MicroBatcher(_recover_batch, window, max_batch)
+
+
+    def split(self, request: Dict[str, object]) -> Dict[str, object]:
+        """
+        Splits the requested mnemonic phrase, and returns the share phrases.
+        """
+        language = Language(request.get("language", Language.English.value))
+        version = request.get("version", current_version)
+        mnemonic = Mnemonic.from_phrase(request["phrase"], language)
+        key = (request["threshold"], request["sharecount"], version)
+
+        if not all(isinstance(value, int) for value in key):
+            message = "The threshold, sharecount, and version must be ints."
+            raise TypeError(message)
+
+        shares = self.split_batcher.submit(key, mnemonic)
+
+        return {"shares": [get_phrase(share, language) for share in shares]}
+
+
+    def recover(self, request: Dict[str, object]) -> Dict[str, object]:
+        """
+        Recovers the mnemonic phrase of the requested share phrases.
+        """
+        language = Language(request.get("language", Language.English.value))
+        shares = [
+            Share.from_share_phrase(phrase, language)
+            for phrase in request["shares"]
+        ]
+
+        if not shares:
+            raise ValueError("No share phrases were given.")
+
+        x_values = tuple(sorted(share.point.X for share in shares))
+        key = (shares[0].version, x_values)
+        mnemonic = self.recover_batcher.submit(key, shares)
+
+        return {"phrase": get_phrase(mnemonic, language)}
+
+
+    def translate(self, request: Dict[str, object]) -> Dict[str, object]:
+        """
+        Translates the requested phrase into the target language.
+        """
+        source = Language(request["source"])
+        target = Language(request["target"])
+
+        return {"phrase": translate_phrase(request["phrase"], source, target)}
+
+
+    def get_stats(self) -> Dict[str, object]:
+        """
+        Returns the request stats, and the recent batch sizes of each batched
+        operation.
+        """
+        stats = self.stats.to_dict()
+        stats["split_batch_sizes"] = _summarize(self.split_batcher)
+        stats["recover_batch_sizes"] = _summarize(self.recover_batcher)
+
+        return stats
+
+
+class LocalHTTPServer(ThreadingHTTPServer):
+    """
+    HTTP server listening on a host and port, with a thread per request.
+    """
+    # Bursts of concurrent clients are queued rather than refused.
+    request_queue_size = 128
+
+
+class UnixHTTPServer(
+        socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    HTTP server listening on a Unix socket, with a thread per request.
+    """
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def make_handler(service: ShamirService) -> type:
+    """
+    Returns a request handler class bound to the given service.
+    """
+    routes = {
+        "/split": service.split,
+        "/recover": service.recover,
+        "/translate": service.translate,
+    }
+
+    class ShamirRequestHandler(BaseHTTPRequestHandler):
+        """
+        Handles JSON requests to the daemon.
+        """
+        def do_GET(self) -> None:
+            if self.path == "/stats":
+                self._send(200, service.get_stats())
+            else:
+                self._send(404, {"error": f"{self.path} was not found."})
+
+
+        def do_POST(self) -> None:
+            route = routes.get(self.path)
+
+            if route is None:
+                self._send(404, {"error": f"{self.path} was not found."})
+                return
+
+            started = time.perf_counter()
+            is_error = False
+
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+
+                if length < 0:
+                    raise ValueError("The Content-Length is not valid.")
+
+                if length > MAX_REQUEST_SIZE:
+                    is_error = True
+                    self.close_connection = True
+                    message = "The request body is too large."
+                    self._send(413, {"error": message})
+                    return
+
+                request = json.loads(self.rfile.read(length))
+                self._send(200, route(request))
+            except Exception as error:
+                is_error = True
+                self._send(400, {"error": str(error)})
+            finally:
+                seconds = time.perf_counter() - started
+                service.stats.record(self.path, seconds, is_error)
+
+
+        def address_string(self) -> str:
+            # Unix socket clients have no address.
+            if isinstance(self.client_address, tuple):
+                return self.client_address[0]
+
+            return "unix"
+
+
+        def log_message(self, format: str, *args: object) -> None:
+            # Requests are counted in the stats instead of logged.
+            pass
+
+
+        def _send(self, status: int, body: Dict[str, object]) -> None:
+            body_bin = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body_bin)))
+            self.end_headers()
+            self.wfile.write(body_bin)
+
+    return ShamirRequestHandler
+
+
+def serve(
+        host: str = "127.0.0.1", port: int = 8339,
+        unix_socket: Optional[str] = None, window: float = 0.002,
+        max_batch: int = 256, allow_remote: bool = False) -> None:
+    """
+    Runs the split and recover daemon until interrupted, listening on the
+    given Unix socket path if one is given, or on the given host and port.
+    Requests and responses hold plaintext mnemonics, so raises an error if
+    the host is not a loopback address, unless allow_remote is set, or if a
+    file other than a socket exists at the Unix socket path. The Unix socket
+    is created with 0600 permissions, so only its owner can connect.
+    """
+    if unix_socket is None and not allow_remote and not _is_loopback(host):
+        raise ValueError(
+            f"The host {host} is not a loopback address, and allow_remote "
+            "was not set."
+        )
+
+    if unix_socket is not None and os.path.lexists(unix_socket):
+        if not stat.S_ISSOCK(os.lstat(unix_socket).st_mode):
+            raise ValueError(f"{unix_socket} exists and is not a socket.")
+
+        os.remove(unix_socket)
+
+    service = ShamirService(window, max_batch)
+    handler = make_handler(service)
+
+    if unix_socket is not None:
+        # The socket is bound under a restrictive umask, so that it is never
+        # open to other local users.
+        previous_umask = os.umask(0o077)
+
+        try:
+            server = UnixHTTPServer(unix_socket, handler)
+        finally:
+            os.umask(previous_umask)
+
+        os.chmod(unix_socket, 0o600)
+    else:
+        server = LocalHTTPServer((host, port), handler)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+        if unix_socket is not None and os.path.exists(unix_socket):
+            os.remove(unix_socket)
+
+
+def _is_loopback(host: str) -> bool:
+    """
+    Returns true if the given host is localhost, or a loopback IP address.
+    """
+    if host == "localhost":
+        return True
+
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _split_batch(
+        key: Tuple[int, int, int], mnemonics: List[Mnemonic]
+        ) -> List[List[Share]]:
+    """
+    Splits a batch of mnemonics that use the same scheme.
+    """
+    threshold, sharecount, version = key
+
+    return create_shares_batch(threshold, sharecount, mnemonics, version)
+
+
+def _recover_batch(
+        key: Tuple[int, Tuple[int, ...]], share_sets: List[List[Share]]
+        ) -> List[object]:
+    """
+    Recovers a batch of share sets that use the same X-values. If the batch
+    fails, each share set is recovered alone, so that only the invalid share
+    sets get an error.
+    """
+    try:
+        return recover_mnemonic_batch(share_sets)
+    except Exception:
+        results = []
+
+        for shares in share_sets:
+            try:
+                results.append(recover_mnemonic(shares))
+            except Exception as error:
+                results.append(error)
+
+        return results
+
+
+def _summarize(batcher: MicroBatcher) -> Dict[str, float]:
+    """
+    Returns the mean and largest of the recent batch sizes of a batcher.
+    """
+    batch_sizes = list(batcher.batch_sizes)
+
+    if not batch_sizes:
+        return {"mean": 0.0, "max": 0}
+
+    return {
+        "mean": sum(batch_sizes) / len(batch_sizes),
+        "max": max(batch_sizes),
+    }
@@ -3,14 +3,52 @@ from .BIP39_List import BIP39_List
 from .encode import Encode
 from .decode import Decode
 from .point import Point
-from .enums import Language
-from typing import List
+from .enums import Checksum, Language
+from typing import List, Tuple
 from hashlib import sha256
 
 
 PRIME_MODULUS = 2 ** 256 - 2 ** 32 - 977
 wordlist = BIP39_List()
-current_version = 0
+
+# Version 0 shares are points over the prime field of PRIME_MODULUS. Version 1
+# shares split the key byte by byte over GF(2^8), so the Y-value holds 32
+# independent byte values. Version 2 shares are points over the same prime
+# field as version 0, with wider threshold and X-value fields for schemes with
+# hundreds of shares.
+PRIME_FIELD_VERSION = 0
+GF256_VERSION = 1
+WIDE_PRIME_FIELD_VERSION = 2
+SHARE_VERSIONS = (
+    PRIME_FIELD_VERSION, GF256_VERSION, WIDE_PRIME_FIELD_VERSION
+)
+current_version = PRIME_FIELD_VERSION
+
+# The largest threshold and X-value that each share version can encode. The
+# share count of a scheme can be at most 1 less than its largest X-value.
+MAX_THRESHOLDS = {
+    PRIME_FIELD_VERSION: 17,
+    GF256_VERSION: 17,
+    WIDE_PRIME_FIELD_VERSION: 257,
+}
+MAX_X_VALUES = {
+    PRIME_FIELD_VERSION: 129,
+    GF256_VERSION: 129,
+    WIDE_PRIME_FIELD_VERSION: 2049,
+}
+
+# The number of bytes and phrase words of each share version. A phrase holds
+# a few more bits than the share bytes, which are filled from the share hash.
+SHARE_SIZES = {
+    PRIME_FIELD_VERSION: 37,
+    GF256_VERSION: 37,
+    WIDE_PRIME_FIELD_VERSION: 38,
+}
+SHARE_WORD_COUNTS = {
+    PRIME_FIELD_VERSION: 27,
+    GF256_VERSION: 27,
+    WIDE_PRIME_FIELD_VERSION: 28,
+}
 
 
 class Share:
@@ -37,6 +75,25 @@ class Share:
     [4: Threshold xor checksum]
     [7: X value xor checksum]
     [16: Checksum]
+
+    Version 0 shares are points on a polynomial over the prime field of
+    PRIME_MODULUS. Version 1 shares hold one point per byte of the key, on 32
+    polynomials over GF(2^8), and their Y value may be any 256-bit value.
+
+    Version 2 shares are points over the same prime field as version 0. They
+    are 38 bytes, represented as 28 words, and the 4 bits of the last word
+    that spill over the 38 bytes are truncated. Their X value is 11 bits,
+    starting at 2, and their threshold has a byte of its own, starting at 2.
+    The 2-byte share checksum is applied as an xor to the 2 bytes containing
+    the version and X value, and its first byte to the threshold.
+
+    304-bit version 2 share structure:
+    [256: Y value]
+    [8: Seed checksum]
+    [5: Version xor checksum]
+    [11: X value xor checksum]
+    [8: Threshold xor checksum]
+    [16: Checksum]
     """
     def __init__(
             self, point: Point, threshold: int, seed_checksum: bytes,
@@ -44,12 +101,16 @@ class Share:
         """
         Initializes an instance of the Share class, and assignes values for the
         (x, y) coordinate, as well as the version, threshold, and checksums. The
-        threshold must be between [2, 17]. The X value must be between [2, 257].
+        threshold must be between [2, 17], and the X value between [2, 129],
+        or for version 2 shares, [2, 257] and [2, 2049].
         """
+        if version not in SHARE_VERSIONS:
+            raise ValueError(f"The share version {version} is not supported.")
+
         if not isinstance(threshold, int):
             raise TypeError("The given threshold argument is not of type int.")
 
-        if threshold < 2 or threshold > 17:
+        if threshold < 2 or threshold > MAX_THRESHOLDS[version]:
             raise ValueError("The given index argument is out of bounds.")
 
         if not isinstance(point, Point):
@@ -58,40 +119,110 @@ class Share:
         if not isinstance(point.X, int):
             raise TypeError("The given X argument is not of type int.")
 
-        if point.X < 2 or point.X > 257:
+        if point.X < 2 or point.X > MAX_X_VALUES[version]:
             raise ValueError("The given X argument is out of bounds.")
 
         if not isinstance(point.Y, int):
             raise TypeError("The given Y argument is not of type int.")
 
-        if point.Y < 1 or point.Y >= PRIME_MODULUS:
+        if version == GF256_VERSION:
+            if point.Y < 0 or point.Y >= 2 ** 256:
+                raise ValueError("The given Y argument is out of bounds.")
+        elif point.Y < 1 or point.Y >= PRIME_MODULUS:
             raise ValueError("The given Y argument is out of bounds.")
         
         if len(seed_checksum) < 1:
             raise ValueError("The given seed_checksum was not at least 1 byte.")
 
-        # Encode the 2-byte sequence containing the version, threshold, and
-        # X-value in order to get the share's checksum.
-        encoded_version = Encode.share_version(version)
-        encoded_threshold = Encode.share_threshold(threshold)
-        encoded_x = Encode.share_X(point.X)
-        
-        # Get the share checksum, which is the last two bytes of the fully
-        # encoded share.
-        share_bytes = Encode.share_bytes(
-            encoded_x, point.Y, encoded_threshold, seed_checksum[:1],
-            encoded_version
-        )
+        self._set_values(point, threshold, seed_checksum[:1], version)
 
-        share_checksum = share_bytes[-2:]
 
-        # Assign instance variables.
-        self.seed_checksum = seed_checksum[:1]
-        self.point = point
-        self.threshold = threshold
-        self.version = version
-        self.share_checksum = share_checksum
-    
+    @classmethod
+    def _from_trusted(
+            cls, point: Point, threshold: int, seed_checksum: bytes,
+            version: int, phrase_int: int = None) -> "Share":
+        """
+        Returns an instance of a Share class without validating the given
+        values, which must already be known to be valid, such as shares just
+        created or decoded by this package. The seed checksum must be 1 byte.
+        The phrase integer may be given if it is already known.
+        """
+        share = cls.__new__(cls)
+        share._set_values(point, threshold, seed_checksum, version)
+        share._phrase_int = phrase_int
+
+        return share
+
+
+    @property
+    def point(self) -> Point:
+        """
+        The (x, y) coordinate of the share. A new Point should be assigned
+        rather than changing the X or Y of the current one, so that the cached
+        phrase integer is cleared.
+        """
+        return self._point
+
+
+    @point.setter
+    def point(self, value: Point) -> None:
+        self._point = value
+        self._phrase_int = None
+
+
+    @property
+    def threshold(self) -> int:
+        """
+        The number of shares needed to recover the key.
+        """
+        return self._threshold
+
+
+    @threshold.setter
+    def threshold(self, value: int) -> None:
+        self._threshold = value
+        self._phrase_int = None
+
+
+    @property
+    def seed_checksum(self) -> bytes:
+        """
+        The 1-byte checksum of the original seed, shared by every share of the
+        same key.
+        """
+        return self._seed_checksum
+
+
+    @seed_checksum.setter
+    def seed_checksum(self, value: bytes) -> None:
+        self._seed_checksum = value
+        self._phrase_int = None
+
+
+    @property
+    def version(self) -> int:
+        """
+        The share version, which determines the field the share is over.
+        """
+        return self._version
+
+
+    @version.setter
+    def version(self, value: int) -> None:
+        self._version = value
+        self._phrase_int = None
+
+
+    @property
+    def share_checksum(self) -> bytes:
+        """
+        The last 2 bytes of the encoded share, which hold the share checksum.
+        It is calculated on first use.
+        """
+        share_int = self._get_phrase_int() >> _extra_bit_count(self.version)
+
+        return (share_int & 0xFF_FF).to_bytes(2, "big")
+
 
     @classmethod
     def from_share_phrase(
@@ -100,8 +231,8 @@ class Share:
         """
         Returns an instance of a Share class according to the given share
         phrase. Raises an error if the language is not in the current language
-        list, the mnemonic phrase has invalid words, or has the wrong number of
-        words.
+        list, the mnemonic phrase has invalid words, or does not have 27
+        words, or 28 words for a version 2 share.
         """
         if not isinstance(language, Language):
             raise ValueError(f"{language} is not in the language list.")
@@ -109,15 +240,44 @@ class Share:
         if not isinstance(phrase, list):
             raise TypeError("The given phrase was not of the list[str] type.")
         
-        if len(phrase) != 27:
-            raise ValueError("The given share phrase did not have 27 words.")
+        if len(phrase) not in (27, 28):
+            message = "The given share phrase did not have 27 or 28 words."
+            raise ValueError(message)
+
+        index_table = wordlist.get_index_table(language)
+        indices = []
 
         for word in phrase:
-            if language not in wordlist.get_language(word):
+            if word not in index_table:
                 raise WordlistError(word, language)
 
-        indices = [wordlist.get_word_index(word, language) for word in phrase]
-        
+            indices.append(index_table[word])
+
+        return cls.from_indices(indices)
+
+
+    @classmethod
+    def from_indices(cls, indices: List[int]) -> "Share":
+        """
+        Returns an instance of a Share class according to the given 27 word
+        list indices of a share phrase, or 28 for a version 2 share, which are
+        the same for every language. Raises an error if there are not 27 or 28
+        indices, or an index is not between 0 and 2047.
+        """
+        if not isinstance(indices, list):
+            raise TypeError("The given indices were not of the list[int] type.")
+
+        if len(indices) not in (27, 28):
+            message = "The given share phrase did not have 27 or 28 words."
+            raise ValueError(message)
+
+        for word_index in indices:
+            if not isinstance(word_index, int):
+                raise TypeError("The given word index is not an int.")
+
+            if word_index < 0 or word_index > 2047:
+                raise IndexError(f"The index, {word_index}, is out of range.")
+
         # Add words from left to right, shifting the added words to the left by
         # 11 bits each iteration.
         share_int = 0
@@ -126,10 +286,64 @@ class Share:
             share_int <<= 11
             share_int += word_index
         
-        # Remove the last bit. A 27-word phrase has an extra bit that spills
-        # over the 37 bytes that should be ignored.
-        share_int >>= 1
+        # Remove the last bits. A 27-word phrase has an extra bit that spills
+        # over the 37 bytes, and a 28-word phrase has 4 extra bits that spill
+        # over the 38 bytes, which should be ignored.
+        share_size = 37 if len(indices) == 27 else 38
+        share_int >>= len(indices) * 11 - share_size * 8
+
+        return cls._from_share_int(share_int, share_size)
+
+
+    @classmethod
+    def from_bytes(cls, share_bytes: bytes) -> "Share":
+        """
+        Returns an instance of a Share class according to the given 37-byte
+        representation, or 38-byte for a version 2 share, as returned by
+        to_bytes(). Raises an error if the bytes are not 37 or 38 bytes long,
+        or the share checksum is not valid.
+        """
+        if not isinstance(share_bytes, bytes):
+            raise TypeError("The given share_bytes argument was not bytes.")
+
+        if len(share_bytes) not in (37, 38):
+            message = "The given share_bytes were not 37 or 38 bytes long."
+            raise ValueError(message)
+
+        share_int = int.from_bytes(share_bytes, "big")
+
+        return cls._from_share_int(share_int, len(share_bytes))
+
+
+    @classmethod
+    def _from_share_int(cls, share_int: int, share_size: int) -> "Share":
+        """
+        Returns an instance of a Share class according to the given integer
+        form of the 37 or 38 share bytes. Raises an error if the share checksum
+        is not valid.
+        """
+        if share_size == 38:
+            decoded_values = Share._decode_wide_share_int(share_int)
+        else:
+            decoded_values = Share._decode_share_int(share_int)
 
+        point, threshold, seed_checksum, version, phrase_int = decoded_values
+
+        return cls._from_trusted(
+            point, threshold, seed_checksum, version, phrase_int
+        )
+
+
+    @staticmethod
+    def _decode_share_int(
+            share_int: int
+            ) -> Tuple[Point, int, bytes, int, int]:
+        """
+        Decodes the given 296-bit integer form of the 37 share bytes, and
+        returns the point, threshold, seed checksum, version, and 297-bit
+        phrase integer of the share. Raises an error if the share checksum is
+        not valid, or a decoded value is out of bounds.
+        """
         # Truncate the right 40 bits to get the Y-value of the share. The
         # Y-value is the left-most 256 bits, with 40 bits to its right.
         y_int = share_int >> 40
@@ -157,54 +371,219 @@ class Share:
         threshold_int = Decode.share_threshold(threshold_encoded)
         x_int = Decode.share_X(x_val_encoded)
 
+        # The share checksum is the first 2 bytes of the hash of the prior 35
+        # bytes, with the version, threshold, and X-value unmasked.
+        bytes_before_checksum = [
+            y_int.to_bytes(32, "big"),
+            seed_checksum_bin,
+            version_threshold_x_val.to_bytes(2, "big")
+        ]
+
+        given_checksum = share_checksum_int.to_bytes(2, "big")
+        share_hash = sha256(b"".join(bytes_before_checksum)).digest()
+        recalculated_checksum = share_hash[:2]
+
+        if given_checksum != recalculated_checksum:
+            raise ChecksumError(
+                Checksum.Share, given_checksum, recalculated_checksum
+            )
+
+        # The threshold and X-value fields cannot hold out of bounds values,
+        # but the version and Y-value can. Version 2 shares are 38 bytes.
+        if version_int not in SHARE_VERSIONS:
+            raise ValueError(
+                f"The share version {version_int} is not supported."
+            )
+
+        if SHARE_SIZES[version_int] != 37:
+            raise ValueError(
+                f"Version {version_int} shares are not 37 bytes long."
+            )
+
+        if version_int != GF256_VERSION:
+            if y_int < 1 or y_int >= PRIME_MODULUS:
+                raise ValueError("The given Y argument is out of bounds.")
+
+        # The phrase integer is rebuilt with the correct extra bit from the
+        # third byte of the hash, so that a miskeyed extra bit is not carried
+        # into rendered phrases.
+        phrase_int = (share_int << 1) | (share_hash[2] >> 7)
         point = Point(x_int, y_int)
 
-        return cls(point, threshold_int, seed_checksum_bin, version_int)
+        return point, threshold_int, seed_checksum_bin, version_int, phrase_int
 
 
-    def to_bytes(self) -> bytes:
+    @staticmethod
+    def _decode_wide_share_int(
+            share_int: int
+            ) -> Tuple[Point, int, bytes, int, int]:
         """
-        returns the 37-byte representation of the current Share instance.
+        Decodes the given 304-bit integer form of the 38 bytes of a version 2
+        share, and returns the point, threshold, seed checksum, version, and
+        308-bit phrase integer of the share. Raises an error if the share
+        checksum is not valid, or a decoded value is out of bounds.
         """
-        # The version, threshold, and X-value are encoded in the same 2-byte
-        # sequence.
-        encoded_version = Encode.share_version(self.version)
-        encoded_threshold = Encode.share_threshold(self.threshold)
-        encoded_x = Encode.share_X(self.point.X)
+        # Truncate the right 48 bits to get the Y-value of the share.
+        y_int = share_int >> 48
+
+        # The seed checksum value is the 6th byte from the right.
+        seed_checksum_int = (share_int >> 40) & 0xFF
+        seed_checksum_bin = seed_checksum_int.to_bytes(1, "big")
+
+        # The next 2 bytes are the version and X-value, followed by the
+        # threshold byte and the 2-byte share checksum.
+        version_x_val = (share_int >> 24) & 0xFF_FF
+        threshold_encoded = (share_int >> 16) & 0xFF
+        share_checksum_int = share_int & 0xFF_FF
 
-        share_bytes = Encode.share_bytes(
-                encoded_x, self.point.Y, encoded_threshold, self.seed_checksum,
-                encoded_version
+        # The version and X-value are masked with the share checksum, and the
+        # threshold with its first byte.
+        version_x_val ^= share_checksum_int
+        threshold_encoded ^= share_checksum_int >> 8
+
+        version_encoded = version_x_val & 0b11111_00000000000
+        x_val_encoded = version_x_val & 0b00000_11111111111
+
+        version_int = Decode.share_version(version_encoded)
+        threshold_int = Decode.wide_share_threshold(threshold_encoded)
+        x_int = Decode.share_X(x_val_encoded)
+
+        # The share checksum is the first 2 bytes of the hash of the prior 36
+        # bytes, with the version, X-value, and threshold unmasked.
+        bytes_before_checksum = [
+            y_int.to_bytes(32, "big"),
+            seed_checksum_bin,
+            version_x_val.to_bytes(2, "big"),
+            threshold_encoded.to_bytes(1, "big")
+        ]
+
+        given_checksum = share_checksum_int.to_bytes(2, "big")
+        share_hash = sha256(b"".join(bytes_before_checksum)).digest()
+        recalculated_checksum = share_hash[:2]
+
+        if given_checksum != recalculated_checksum:
+            raise ChecksumError(
+                Checksum.WideShare, given_checksum, recalculated_checksum
             )
-        
-        return share_bytes
+
+        if version_int != WIDE_PRIME_FIELD_VERSION:
+            raise ValueError(
+                f"Version {version_int} shares are not 38 bytes long."
+            )
+
+        if y_int < 1 or y_int >= PRIME_MODULUS:
+            raise ValueError("The given Y argument is out of bounds.")
+
+        # The phrase integer is rebuilt with the correct 4 extra bits from the
+        # third byte of the hash.
+        phrase_int = (share_int << 4) | (share_hash[2] >> 4)
+        point = Point(x_int, y_int)
+
+        return point, threshold_int, seed_checksum_bin, version_int, phrase_int
+
+
+    def to_bytes(self) -> bytes:
+        """
+        returns the 37-byte representation of the current Share instance, or
+        the 38-byte representation of a version 2 share.
+        """
+        # The phrase integer holds the bits of the share, followed by the
+        # extra bits of the last word.
+        share_int = self._get_phrase_int() >> _extra_bit_count(self.version)
+
+        return share_int.to_bytes(SHARE_SIZES[self.version], "big")
 
     
     def get_word(self, index: int, language: Language) -> str:
         """
         Returns the word at the given zero-based index of this Share class
-        instance. Raises error if the index is not between 0 and 26.
+        instance. Raises error if the index is not between 0 and 26, or 27 for
+        a version 2 share.
         """
         if not isinstance(index, int):
             raise TypeError("The index argument given is not an int.")
 
-        if index < 0 or index > 26:
+        max_words = SHARE_WORD_COUNTS[self.version]
+
+        if index < 0 or index >= max_words:
             raise IndexError("The index argument given is out of bounds.")
             
         if not isinstance(language, Language):
             raise ValueError(f"{language} is not in the language list.")
 
+        share_int = self._get_phrase_int()
+
+        # Determine number of bits to truncate from the right based the word's
+        # position in the phrase.
+        word_position = index + 1
+        remove_word_count = max_words - word_position
+        truncated_share_int = share_int >> (remove_word_count * 11)
+
+        # Get word index and return word text.
+        word_bitmask = 0b1111_1111_111
+        word_index = truncated_share_int & word_bitmask
+        word = wordlist.get_word(word_index, language)
+
+        return word
+
+
+    def get_word_indices(self) -> List[int]:
+        """
+        Returns the 27 word list indices of this Share class instance, or 28
+        for a version 2 share, which are the same for every language.
+        """
+        share_int = self._get_phrase_int()
+        word_bitmask = 0b1111_1111_111
+        max_words = SHARE_WORD_COUNTS[self.version]
+
+        # The first word is the left-most 11 bits of the phrase integer.
+        return [
+            (share_int >> (remove_word_count * 11)) & word_bitmask
+            for remove_word_count in range(max_words - 1, -1, -1)
+        ]
+
+
+    def _set_values(
+            self, point: Point, threshold: int, seed_checksum: bytes,
+            version: int) -> None:
+        """
+        Assigns the instance variables of this Share class instance, and
+        clears the cached phrase integer.
+        """
+        # The phrase integer, which holds the share checksum, is built
+        # on first use, and cleared whenever a value is replaced.
+        self._seed_checksum = seed_checksum
+        self._point = point
+        self._threshold = threshold
+        self._version = version
+        self._phrase_int = None
+
+
+    def _get_phrase_int(self) -> int:
+        """
+        Returns the integer represented by the words of this Share class
+        instance's phrase, which is calculated on first use.
+        """
+        if self._phrase_int is None:
+            self._phrase_int = self._calculate_phrase_int()
+
+        return self._phrase_int
+
+
+    def _calculate_phrase_int(self) -> int:
+        """
+        Returns the integer represented by the words of this Share class
+        instance's phrase, which is 297 bits for 27 words, or 308 bits for the
+        28 words of a version 2 share.
+        """
+        if self.version == WIDE_PRIME_FIELD_VERSION:
+            return self._calculate_wide_phrase_int()
+
         # The version, threshold, and X-value are encoded in the same 2-byte
         # sequence.
         version_int = Encode.share_version(self.version)
         threshold_int = Encode.share_threshold(self.threshold)
         x_int = Encode.share_X(self.point.X)
-
-        share_bytes = Encode.share_bytes(
-            x_int, self.point.Y, threshold_int, self.seed_checksum, version_int
-        )
-        
-        # Rehash the share to get the extra bit for the 27th word.
         version_threshold_x_int = version_int + threshold_int + x_int
         version_threshold_x_bin = version_threshold_x_int.to_bytes(2, "big")
 
@@ -214,29 +593,74 @@ class Share:
             version_threshold_x_bin
         ]
 
-        extra_byte = sha256(b"".join(bytes_before_checksum)).digest()[2:3]
+        # The first 2 bytes of the hash are the share checksum, and the third
+        # byte supplies the extra bit for the 27th word.
+        share_hash = sha256(b"".join(bytes_before_checksum)).digest()
+        share_checksum_int = int.from_bytes(share_hash[:2], "big")
+        version_threshold_x_xor = version_threshold_x_int ^ share_checksum_int
+
+        share_byte_array = [
+            bytes_before_checksum[0],
+            self.seed_checksum,
+            version_threshold_x_xor.to_bytes(2, "big"),
+            share_hash[:3]
+        ]
 
         # Join the share bytes and remove 7 bits from the third byte of the
         # share checksum.
+        share_bin = b"".join(share_byte_array)
+        share_int = int.from_bytes(share_bin, "big")
+        share_int >>= 7
+
+        return share_int
+
+
+    def _calculate_wide_phrase_int(self) -> int:
+        """
+        Returns the 308-bit integer represented by the 28 words of this
+        version 2 Share class instance's phrase.
+        """
+        # The version and X-value are encoded in the same 2-byte sequence,
+        # followed by the threshold byte.
+        version_int = Encode.share_version(self.version)
+        x_int = Encode.share_X(self.point.X)
+        version_x_int = version_int + x_int
+        threshold_int = Encode.wide_share_threshold(self.threshold)
+
+        bytes_before_checksum = [
+            self.point.Y.to_bytes(32, "big"),
+            self.seed_checksum,
+            version_x_int.to_bytes(2, "big"),
+            threshold_int.to_bytes(1, "big")
+        ]
+
+        # The first 2 bytes of the hash are the share checksum, and the third
+        # byte supplies the 4 extra bits for the 28th word.
+        share_hash = sha256(b"".join(bytes_before_checksum)).digest()
+        share_checksum_int = int.from_bytes(share_hash[:2], "big")
+        version_x_xor = version_x_int ^ share_checksum_int
+        threshold_xor = threshold_int ^ share_hash[0]
+
         share_byte_array = [
-            share_bytes,
-            extra_byte
+            bytes_before_checksum[0],
+            self.seed_checksum,
+            version_x_xor.to_bytes(2, "big"),
+            threshold_xor.to_bytes(1, "big"),
+            share_hash[:3]
         ]
 
+        # Join the share bytes and remove 4 bits from the third byte of the
+        # hash.
         share_bin = b"".join(share_byte_array)
         share_int = int.from_bytes(share_bin, "big")
-        share_int >>= 7
+        share_int >>= 4
 
-        # Determine number of bits to truncate from the right based the word's
-        # position in the phrase.
-        max_words = 27
-        word_position = index + 1
-        remove_word_count = max_words - word_position
-        truncated_share_int = share_int >> (remove_word_count * 11)
+        return share_int
 
-        # Get word index and return word text.
-        word_bitmask = 0b1111_1111_111
-        word_index = truncated_share_int & word_bitmask
-        word = wordlist.get_word(word_index, language)
 
-        return word
+def _extra_bit_count(version: int) -> int:
+    """
+    Returns the number of bits that the phrase of a share of the given version
+    has beyond its share bytes.
+    """
+    return SHARE_WORD_COUNTS[version] * 11 - SHARE_SIZES[version] * 8
@@ -0,0 +1,15 @@
+from typing import List
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Returns the value at the given fraction, between 0 and 1, of the given
+    sorted values, or 0 if there are no values. Used for the latency
+    percentiles of the daemon stats and the load test report.
+    """
+    if not sorted_values:
+        return 0.0
+
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+
+    return sorted_values[index]
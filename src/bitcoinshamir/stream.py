@@ -0,0 +1,266 @@
+import os
+from hashlib import sha256
+from typing import BinaryIO, List, Tuple
+from .enums import Checksum
+from .exceptions import ChecksumError, ThresholdError
+from .gf256 import GF256
+
+
+# Every share stream starts with a 24-byte header:
+# [4: Magic bytes]
+# [1: Format version]
+# [1: Threshold]
+# [1: X value]
+# [1: Reserved]
+# [8: Group ID, shared by every stream of the same split]
+# [4: Chunk size]
+# [4: Header checksum]
+#
+# The header is followed by chunk records, each holding the share bytes of
+# one chunk of the secret, and ending with an empty record:
+# [4: Share byte count]
+# [n: Share bytes]
+# [4: Chunk checksum]
+STREAM_MAGIC = b"BSSS"
+STREAM_VERSION = 1
+HEADER_SIZE = 24
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Each chunk is split together with its sha256 hash, so the recombined chunk
+# can be verified without revealing the hash in any single share stream.
+CHUNK_HASH_SIZE = 32
+
+
+def split_stream(
+        threshold: int, sharecount: int, source: BinaryIO,
+        sinks: List[BinaryIO], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """
+    Splits the bytes read from the given source file object into a (k, n)
+    threshold scheme, writing one share stream to each of the given sink file
+    objects. The source is read one chunk at a time, so memory use is bounded
+    by the chunk size rather than the size of the source.
+    """
+    if not isinstance(threshold, int):
+        raise TypeError("The threshold argument was not of the int type.")
+
+    if threshold < 2 or threshold > 254:
+        raise ValueError("The given threshold argument is out of bounds.")
+
+    if not isinstance(sharecount, int):
+        raise TypeError("The sharecount argument was not of the int type.")
+
+    if sharecount < threshold or sharecount > 254:
+        raise ValueError("The given sharecount argument is out of bounds.")
+
+    if not isinstance(sinks, list) or len(sinks) != sharecount:
+        raise ValueError("The sinks argument needs one file per share.")
+
+    if not isinstance(chunk_size, int):
+        raise TypeError("The chunk_size argument was not of the int type.")
+
+    if chunk_size < 1 or chunk_size > 2 ** 31:
+        raise ValueError("The given chunk_size argument is out of bounds.")
+
+    # The secret is at x=0, followed by random rows for the rest of the
+    # threshold, which start at x=2 as they do for shares. The remaining
+    # streams are interpolated from this fixed layout.
+    base_x_values = (0,) + tuple(range(2, threshold + 1))
+    share_x_values = range(2, sharecount + 2)
+    group_id = os.urandom(8)
+
+    for x_val, sink in zip(share_x_values, sinks):
+        sink.write(_stream_header(threshold, x_val, group_id, chunk_size))
+
+    chunk_index = 0
+
+    while True:
+        chunk = source.read(chunk_size)
+
+        if not chunk:
+            break
+
+        secret_row = chunk + sha256(chunk).digest()
+        base_rows = [secret_row]
+        base_rows.extend(
+            os.urandom(len(secret_row)) for _ in range(threshold - 1)
+        )
+
+        for x_val, sink in zip(share_x_values, sinks):
+            if x_val <= threshold:
+                share_row = base_rows[x_val - 1]
+            else:
+                share_row = GF256.interpolate(base_x_values, base_rows, x_val)
+
+            sink.write(_chunk_record(group_id, chunk_index, share_row))
+
+        chunk_index += 1
+
+    # An empty record marks the end of each stream, so truncated streams are
+    # detected when they are combined.
+    for sink in sinks:
+        sink.write(_chunk_record(group_id, chunk_index, b""))
+
+
+def combine_streams(sources: List[BinaryIO], sink: BinaryIO) -> None:
+    """
+    Recombines the given share stream file objects, and writes the original
+    bytes to the given sink file object. Raises an error if the streams are
+    not from the same split, do not meet the threshold, or fail a checksum.
+    """
+    if not isinstance(sources, list) or len(sources) < 1:
+        raise ValueError("The sources argument needs at least one file.")
+
+    headers = [_read_stream_header(source) for source in sources]
+    threshold, _, group_id, chunk_size = headers[0]
+
+    for header_threshold, _, header_group_id, _ in headers:
+        if header_group_id != group_id or header_threshold != threshold:
+            raise ValueError("The given streams are not from the same split.")
+
+    x_values = tuple(x_val for _, x_val, _, _ in headers)
+
+    if len(set(x_values)) != len(x_values):
+        raise ValueError("The given streams have duplicate X-values.")
+
+    if len(sources) < threshold:
+        raise ThresholdError(threshold, len(sources))
+
+    # Only the threshold number of streams is needed to interpolate.
+    sources = sources[:threshold]
+    x_values = x_values[:threshold]
+    chunk_index = 0
+
+    while True:
+        rows = [
+            _read_chunk_record(source, group_id, chunk_index, chunk_size)
+            for source in sources
+        ]
+
+        if len({len(row) for row in rows}) != 1:
+            raise ValueError("The given streams have different chunk sizes.")
+
+        if not rows[0]:
+            break
+
+        secret_row = GF256.interpolate(x_values, rows, 0)
+        chunk = secret_row[:-CHUNK_HASH_SIZE]
+        original_hash = secret_row[-CHUNK_HASH_SIZE:]
+        recalculated_hash = sha256(chunk).digest()
+
+        if original_hash != recalculated_hash:
+            raise ChecksumError(
+                Checksum.StreamData, original_hash, recalculated_hash
+            )
+
+        sink.write(chunk)
+        chunk_index += 1
+
+
+def _stream_header(
+        threshold: int, x_val: int, group_id: bytes, chunk_size: int
+        ) -> bytes:
+    """
+    Returns the header bytes of a share stream.
+    """
+    header = b"".join([
+        STREAM_MAGIC,
+        bytes([STREAM_VERSION, threshold, x_val, 0]),
+        group_id,
+        chunk_size.to_bytes(4, "big")
+    ])
+
+    return header + sha256(header).digest()[:4]
+
+
+def _read_stream_header(source: BinaryIO) -> Tuple[int, int, bytes, int]:
+    """
+    Reads the header of a share stream, and returns its threshold, X-value,
+    group ID, and chunk size. Raises an error if the header is not valid.
+    """
+    header = source.read(HEADER_SIZE)
+
+    if len(header) != HEADER_SIZE or header[:4] != STREAM_MAGIC:
+        raise ValueError("The given source is not a share stream.")
+
+    if header[4] != STREAM_VERSION:
+        raise ValueError(f"The stream version {header[4]} is not supported.")
+
+    given_checksum = header[-4:]
+    recalculated_checksum = sha256(header[:-4]).digest()[:4]
+
+    if given_checksum != recalculated_checksum:
+        raise ChecksumError(
+            Checksum.StreamChunk, given_checksum, recalculated_checksum
+        )
+
+    threshold = header[5]
+    x_val = header[6]
+    group_id = header[8:16]
+    chunk_size = int.from_bytes(header[16:20], "big")
+
+    return threshold, x_val, group_id, chunk_size
+
+
+def _chunk_record(
+        group_id: bytes, chunk_index: int, share_row: bytes
+        ) -> bytes:
+    """
+    Returns a chunk record of a share stream. The chunk checksum covers the
+    group ID and chunk index, so records from other splits or positions are
+    rejected.
+    """
+    length_bin = len(share_row).to_bytes(4, "big")
+    checksum = _chunk_checksum(group_id, chunk_index, length_bin, share_row)
+
+    return b"".join([length_bin, share_row, checksum])
+
+
+def _read_chunk_record(
+        source: BinaryIO, group_id: bytes, chunk_index: int, chunk_size: int
+        ) -> bytes:
+    """
+    Reads a chunk record of a share stream, and returns its share bytes.
+    Raises an error if the record is truncated or fails its checksum.
+    """
+    length_bin = source.read(4)
+
+    if len(length_bin) != 4:
+        raise ValueError("The given share stream is truncated.")
+
+    length = int.from_bytes(length_bin, "big")
+
+    if length > chunk_size + CHUNK_HASH_SIZE:
+        raise ValueError("The given share stream has an invalid chunk.")
+
+    share_row = source.read(length)
+    given_checksum = source.read(4)
+
+    if len(share_row) != length or len(given_checksum) != 4:
+        raise ValueError("The given share stream is truncated.")
+
+    recalculated_checksum = _chunk_checksum(
+        group_id, chunk_index, length_bin, share_row
+    )
+
+    if given_checksum != recalculated_checksum:
+        raise ChecksumError(
+            Checksum.StreamChunk, given_checksum, recalculated_checksum
+        )
+
+    return share_row
+
+
+def _chunk_checksum(
+        group_id: bytes, chunk_index: int, length_bin: bytes, share_row: bytes
+        ) -> bytes:
+    """
+    Returns the 4-byte checksum of a chunk record.
+    """
+    checksum_input = [
+        group_id,
+        chunk_index.to_bytes(8, "big"),
+        length_bin,
+        share_row
+    ]
+
+    return sha256(b"".join(checksum_input)).digest()[:4]